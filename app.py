@@ -6,7 +6,7 @@ load_dotenv()
 import os
 import json
 from datetime import datetime
-from config import RUTA_CONFIG_JSON
+from config import RUTA_CONFIG_JSON, RUTA_RECURSOS
 
 # Import service layer
 from services.data_manager import DataManager
@@ -27,6 +27,7 @@ app = Flask(__name__, template_folder='.', static_folder='static')
 data_manager = DataManager()
 latex_processor = LaTeXProcessor()
 pdf_generator = PDFGenerator(latex_processor)
+pdf_generator.precompile_templates(RUTA_RECURSOS)
 system_checker = SystemChecker()
 
 # Perform startup validation
@@ -763,6 +764,9 @@ def validar_sistema():
     try:
         logger.info("Starting comprehensive system validation")
         
+        # On-demand check: probe again instead of reusing the startup result
+        system_checker.invalidate_cache()
+        
         # Use SystemChecker for comprehensive validation
         dependency_result = system_checker.check_all_dependencies()
         data_integrity = data_manager.validate_data_integrity()
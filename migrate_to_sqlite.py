@@ -12,7 +12,7 @@ from datetime import datetime
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from services.database import DatabaseManager
+from services.database import DatabaseManager, legacy_investments_csv_path
 from services.logging_config import get_logger
 import config
 
@@ -26,16 +26,20 @@ def main():
     
     # Initialize database manager
     db_manager = DatabaseManager("peco.db")
+    db_manager.init_database()
     
     # Check if data files exist
+    csv_inversiones = legacy_investments_csv_path(config.XLSX_INVERSIONES)
     csv_exists = os.path.exists(config.CSV_GASTOS)
     xlsx_exists = os.path.exists(config.XLSX_INVERSIONES)
+    csv_inversiones_exists = os.path.exists(csv_inversiones)
     
     print(f"📁 Archivos de datos:")
     print(f"   Gastos CSV: {'✓' if csv_exists else '✗'} {config.CSV_GASTOS}")
     print(f"   Inversiones Excel: {'✓' if xlsx_exists else '✗'} {config.XLSX_INVERSIONES}")
+    print(f"   Inversiones CSV pendientes: {'✓' if csv_inversiones_exists else '✗'} {csv_inversiones}")
     
-    if not csv_exists and not xlsx_exists:
+    if not csv_exists and not xlsx_exists and not csv_inversiones_exists:
         print("\n⚠️  No se encontraron archivos de datos para migrar.")
         print("   La base de datos SQLite está lista para usar.")
         return
@@ -54,7 +58,8 @@ def main():
     try:
         result = db_manager.migrate_from_csv_excel(
             config.CSV_GASTOS,
-            config.XLSX_INVERSIONES
+            config.XLSX_INVERSIONES,
+            csv_inversiones
         )
         
         if result.success:
@@ -75,7 +80,7 @@ def main():
             backup_response = input("   Esto los renombrará con .backup (s/N): ").lower().strip()
             
             if backup_response in ['s', 'si', 'sí', 'y', 'yes']:
-                backup_files(csv_exists, xlsx_exists)
+                backup_files(csv_exists, xlsx_exists, csv_inversiones_exists)
             
             print(f"\n🎉 ¡Migración completada exitosamente!")
             print(f"   Tu aplicación ahora usará SQLite para mejor rendimiento.")
@@ -90,8 +95,8 @@ def main():
         print(f"❌ Error inesperado: {e}")
 
 
-def backup_files(csv_exists: bool, xlsx_exists: bool):
-    """Backup original files."""
+def backup_files(csv_exists: bool, xlsx_exists: bool, csv_inversiones_exists: bool = False):
+    """Backup original files, including the legacy investments CSV sink."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     try:
@@ -104,6 +109,12 @@ def backup_files(csv_exists: bool, xlsx_exists: bool):
             backup_path = f"{config.XLSX_INVERSIONES}.backup_{timestamp}"
             os.rename(config.XLSX_INVERSIONES, backup_path)
             print(f"   ✓ Excel respaldado: {backup_path}")
+        
+        if csv_inversiones_exists:
+            csv_inversiones = legacy_investments_csv_path(config.XLSX_INVERSIONES)
+            backup_path = f"{csv_inversiones}.backup_{timestamp}"
+            os.rename(csv_inversiones, backup_path)
+            print(f"   ✓ CSV de inversiones respaldado: {backup_path}")
             
     except Exception as e:
         print(f"   ⚠️  Error creando backup: {e}")
@@ -5,8 +5,10 @@ Implements standardized data structure validation and integrity checks.
 """
 
 import json
+import logging
 import os
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 
@@ -17,6 +19,31 @@ from .logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _copy_config(value: Any) -> Any:
+    """
+    Copy JSON-shaped configuration data.
+    Only dicts and lists are copied; immutable scalars are shared, which avoids
+    the memo bookkeeping and per-object dispatch of copy.deepcopy.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a read-only view of nested configuration data.
+    Dicts become MappingProxyType objects and lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 @dataclass
 class ValidationResult(Result):
     """Result class for configuration validation operations."""
@@ -587,11 +614,10 @@ class ConfigValidator:
         
         try:
             # Create a deep copy to avoid modifying original data
-            import copy
-            processed_config = copy.deepcopy(config_data)
+            processed_config = _copy_config(config_data)
             
             # Normalize configuration structure first
-            normalize_result = self.normalize_configuration_structure(processed_config)
+            normalize_result = self.normalize_configuration_structure(processed_config, copy=False)
             if normalize_result.success:
                 processed_config = normalize_result.data
             
@@ -667,35 +693,47 @@ class ConfigValidator:
                 validation_errors=[f"Processing error: {str(e)}"]
             )
     
-    def normalize_configuration_structure(self, config_data: Dict[str, Any]) -> ValidationResult:
+    def normalize_configuration_structure(self, config_data: Dict[str, Any], *,
+                                          copy: bool = True,
+                                          freeze: bool = False) -> ValidationResult:
         """
         Normalize configuration structure to the standardized format.
         Converts 'presupuesto' to 'items' for backward compatibility.
         
         Args:
             config_data: Configuration data to normalize
+            copy: If True, the input is left untouched and a copy of the top-level
+                  dict and its 'anexo' is normalized instead. Pass False when the
+                  caller owns config_data and it may be modified in place.
+            freeze: If True, the normalized data is returned as a read-only view
+                    (MappingProxyType for dicts, tuple for lists) that can be shared
+                    between readers without defensive copying.
             
         Returns:
             ValidationResult with normalized configuration data
         """
-        self.logger.info("Normalizing configuration structure")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Normalizing configuration structure")
         
         try:
-            # Create a deep copy to avoid modifying original data
-            import copy
-            normalized_config = copy.deepcopy(config_data)
+            # Only the top-level dict and 'anexo' are modified, so a shallow copy
+            # of those two levels is enough to keep the original data intact
+            normalized_config = dict(config_data) if copy else config_data
             
             # Normalize anexo structure
-            if 'anexo' in normalized_config and isinstance(normalized_config['anexo'], dict):
-                anexo = copy.deepcopy(normalized_config['anexo'])
+            anexo = normalized_config.get('anexo')
+            if isinstance(anexo, dict):
+                if copy:
+                    anexo = dict(anexo)
+                    normalized_config['anexo'] = anexo
                 
                 # Convert 'presupuesto' to 'anexo_items' to avoid conflict with dict.items() method
                 if 'presupuesto' in anexo and 'anexo_items' not in anexo:
-                    anexo['anexo_items'] = anexo['presupuesto']
-                    del anexo['presupuesto']
-                    self.logger.info("Converted 'presupuesto' field to 'anexo_items' for standardization")
-                
-                normalized_config['anexo'] = anexo
+                    anexo['anexo_items'] = anexo.pop('presupuesto')
+                    self.logger.debug("Converted 'presupuesto' field to 'anexo_items' for standardization")
+            
+            if freeze:
+                normalized_config = _freeze(normalized_config)
             
             return ValidationResult(
                 success=True,
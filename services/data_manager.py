@@ -7,18 +7,103 @@ Now uses SQLite database for improved performance and functionality.
 
 import os
 import csv
+import copy
 import json
-import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from collections import defaultdict
+from dataclasses import replace
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 
 from .base import Result, AnalysisResult
 from .exceptions import DataError, ConfigurationError
 from .logging_config import get_logger
-from .database import DatabaseManager
+from .database import DatabaseManager, EXCEL_ENGINE, legacy_investments_csv_path
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
+# Use the Rust-based orjson parser for the budget file when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Maximum number of past months kept in the monthly analysis cache
+ANALYSIS_CACHE_SIZE = 64
+
+_VALID_OP_TYPES = frozenset({'Compra', 'Venta'})
+
+# Shared input validation results. They are returned as-is by the validators,
+# so callers must not modify them (use dataclasses.replace to derive new ones).
+_VALID_DATA = Result(success=True, message="Datos válidos")
+_INVALID_AMOUNT = Result(
+    success=False,
+    message="El monto debe ser mayor a 0",
+    error_code="INVALID_AMOUNT"
+)
+_MISSING_CATEGORY = Result(
+    success=False,
+    message="La categoría es requerida",
+    error_code="MISSING_CATEGORY"
+)
+_MISSING_DESCRIPTION = Result(
+    success=False,
+    message="La descripción es requerida",
+    error_code="MISSING_DESCRIPTION"
+)
+_AMOUNT_TOO_HIGH = Result(
+    success=False,
+    message="El monto parece excesivamente alto. Verifique el valor",
+    error_code="AMOUNT_TOO_HIGH"
+)
+_MISSING_ASSET = Result(
+    success=False,
+    message="El activo es requerido",
+    error_code="MISSING_ASSET"
+)
+_INVALID_OPERATION_TYPE = Result(
+    success=False,
+    message="El tipo de operación debe ser 'Compra' o 'Venta'",
+    error_code="INVALID_OPERATION_TYPE"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_db(db_path: str) -> DatabaseManager:
+    """
+    Return the process-wide DatabaseManager for db_path.
+    Schema bootstrap runs only on first use.
+    """
+    return DatabaseManager(db_path)
+
+
+def _is_number(value: Optional[str]) -> bool:
+    """Return True if a CSV field parses as a number other than NaN."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return False
+    return number == number
+
+
+@lru_cache(maxsize=4)
+def _read_budget_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse the budget JSON file at path.
+    mtime is part of the cache key, so an edited file is read again.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _today_iso() -> str:
+    """Return today's date in 'YYYY-MM-DD' format."""
+    return date.today().isoformat()
+
 
 class DataManager:
     """
@@ -41,6 +126,8 @@ class DataManager:
         self.config = config_module
         self.csv_gastos = config_module.CSV_GASTOS
         self.xlsx_inversiones = config_module.XLSX_INVERSIONES
+        # Append-only sink for legacy investment registrations
+        self.csv_inversiones = legacy_investments_csv_path(self.xlsx_inversiones)
         self.json_presupuesto = config_module.JSON_PRESUPUESTO
         self.ruta_trackers = config_module.RUTA_TRACKERS
         self.ruta_reportes = config_module.RUTA_REPORTES
@@ -48,12 +135,15 @@ class DataManager:
         # Initialize database manager
         self.use_database = use_database
         if self.use_database:
-            self.db_manager = DatabaseManager("peco.db")
+            self.db_manager = _get_db("peco.db")
             logger.info("DataManager initialized with SQLite database")
         else:
             self.db_manager = None
             logger.info("DataManager initialized with legacy file system")
         
+        # Monthly analysis cache: (month, year) -> (data fingerprint, AnalysisResult)
+        self._analysis_cache: Dict[Tuple[int, int], Tuple[Tuple, AnalysisResult]] = {}
+        
         logger.info("DataManager initialized")
     
     def register_expense(self, amount: float, category: str, description: str) -> Result:
@@ -78,7 +168,8 @@ class DataManager:
             
             # Use SQLite database if enabled
             if self.use_database and self.db_manager:
-                fecha = datetime.now().strftime("%Y-%m-%d")
+                fecha = _today_iso()
+                self._analysis_cache.clear()
                 return self.db_manager.add_expense(fecha, category, description, amount)
             
             # Legacy CSV file method
@@ -94,7 +185,7 @@ class DataManager:
     
     def register_investment(self, asset: str, operation_type: str, amount: float) -> Result:
         """
-        Register a new investment operation using SQLite database or legacy Excel file.
+        Register a new investment operation using SQLite database or legacy files.
         
         Args:
             asset: Asset ticker or name
@@ -114,11 +205,12 @@ class DataManager:
             
             # Use SQLite database if enabled
             if self.use_database and self.db_manager:
-                fecha = datetime.now().strftime("%Y-%m-%d")
+                fecha = _today_iso()
+                self._analysis_cache.clear()
                 return self.db_manager.add_investment(fecha, asset, operation_type, amount)
             
-            # Legacy Excel file method
-            return self._register_investment_excel(asset, operation_type, amount)
+            # Legacy file method
+            return self._register_investment_csv(asset, operation_type, amount)
             
         except Exception as e:
             logger.error(f"Error registering investment: {e}")
@@ -126,15 +218,88 @@ class DataManager:
                 success=False,
                 message=f"Error al registrar inversión: {str(e)}",
                 error_code="INVESTMENT_REGISTRATION_ERROR"
-            )  
-  
-    def get_monthly_analysis(self, month: int, year: int) -> AnalysisResult:
+            )
+
+    def register_expenses_bulk(self, rows: List[Tuple[str, str, str, float]]) -> Result:
+        """
+        Register several expenses in a single database transaction.
+
+        Args:
+            rows: List of (fecha, categoria, descripcion, monto) tuples
+
+        Returns:
+            Result object indicating success or failure
+        """
+        try:
+            logger.info(f"Registering {len(rows)} expenses in bulk")
+
+            if not (self.use_database and self.db_manager):
+                return Result(
+                    success=False,
+                    message="El registro masivo requiere la base de datos SQLite",
+                    error_code="DATABASE_REQUIRED"
+                )
+
+            for index, (fecha, categoria, descripcion, monto) in enumerate(rows, start=1):
+                validation_result = self._validate_expense_data(monto, categoria, descripcion)
+                if not validation_result.success:
+                    return replace(validation_result, message=f"Fila {index}: {validation_result.message}")
+
+            self._analysis_cache.clear()
+            return self.db_manager.add_expenses_bulk(rows)
+
+        except Exception as e:
+            logger.error(f"Error registering expenses in bulk: {e}")
+            return Result(
+                success=False,
+                message=f"Error al registrar gastos: {str(e)}",
+                error_code="EXPENSE_REGISTRATION_ERROR"
+            )
+
+    def register_investments_bulk(self, rows: List[Tuple[str, str, str, float]]) -> Result:
+        """
+        Register several investment operations in a single database transaction.
+
+        Args:
+            rows: List of (fecha, activo, tipo, monto) tuples
+
+        Returns:
+            Result object indicating success or failure
+        """
+        try:
+            logger.info(f"Registering {len(rows)} investments in bulk")
+
+            if not (self.use_database and self.db_manager):
+                return Result(
+                    success=False,
+                    message="El registro masivo requiere la base de datos SQLite",
+                    error_code="DATABASE_REQUIRED"
+                )
+
+            for index, (fecha, activo, tipo, monto) in enumerate(rows, start=1):
+                validation_result = self._validate_investment_data(activo, tipo, monto)
+                if not validation_result.success:
+                    return replace(validation_result, message=f"Fila {index}: {validation_result.message}")
+
+            self._analysis_cache.clear()
+            return self.db_manager.add_investments_bulk(rows)
+
+        except Exception as e:
+            logger.error(f"Error registering investments in bulk: {e}")
+            return Result(
+                success=False,
+                message=f"Error al registrar inversiones: {str(e)}",
+                error_code="INVESTMENT_REGISTRATION_ERROR"
+            )
+
+    def get_monthly_analysis(self, month: int, year: int, include_records: bool = False) -> AnalysisResult:
         """
         Get comprehensive monthly financial analysis using SQLite or legacy files.
         
         Args:
             month: Month number (1-12)
             year: Year
+            include_records: Include the individual legacy file rows in analysis_data
             
         Returns:
             AnalysisResult with financial analysis data
@@ -159,10 +324,10 @@ class DataManager:
             
             # Use SQLite database if enabled
             if self.use_database and self.db_manager:
-                return self._get_monthly_analysis_db(month, year)
+                return self._get_cached_monthly_analysis_db(month, year)
             
             # Legacy file-based analysis
-            return self._get_monthly_analysis_files(month, year)
+            return self._get_monthly_analysis_files(month, year, include_records)
             
         except Exception as e:
             logger.error(f"Error generating monthly analysis: {e}")
@@ -203,11 +368,13 @@ class DataManager:
             issues = []
             validated_items = []
             
-            # Check if database file exists
-            if not os.path.exists("peco.db"):
+            # The schema is created lazily on first use, so open the database
+            # (creating it on a fresh install) rather than testing for the file
+            init_result = self.db_manager.init_database()
+            if not init_result.success:
                 return Result(
                     success=False,
-                    message="Base de datos SQLite no encontrada",
+                    message=f"Base de datos SQLite no disponible: {init_result.message}",
                     error_code="DATABASE_NOT_FOUND"
                 )
             
@@ -226,18 +393,12 @@ class DataManager:
                 if stats['database_size_bytes'] < 1024:  # Less than 1KB
                     issues.append("Base de datos muy pequeña - posible corrupción")
             
-            # Test basic database operations
-            try:
-                # Try to get current month analysis
-                current_month = datetime.now().month
-                current_year = datetime.now().year
-                analysis_result = self.db_manager.get_monthly_summary(current_year, current_month)
-                if analysis_result.success:
-                    validated_items.append("Consultas de análisis funcionando")
-                else:
-                    issues.append(f"Error en consultas: {analysis_result.message}")
-            except Exception as e:
-                issues.append(f"Error probando consultas: {str(e)}")
+            # Check database consistency
+            integrity_result = self.db_manager.quick_check()
+            if integrity_result.success:
+                validated_items.append("Integridad de base de datos (quick_check)")
+            else:
+                issues.append(integrity_result.message)
             
             # Check budget file (still used)
             budget_check = self._validate_budget_file()
@@ -329,26 +490,11 @@ class DataManager:
     def _register_expense_csv(self, amount: float, category: str, description: str) -> Result:
         """Legacy method to register expense in CSV file."""
         try:
-            # Ensure directory exists
-            if not os.path.exists(self.ruta_trackers):
-                os.makedirs(self.ruta_trackers)
-                logger.info(f"Created directory: {self.ruta_trackers}")
-            
-            # Check if file exists and create headers if needed
-            file_exists = os.path.isfile(self.csv_gastos)
-            if not file_exists:
-                with open(self.csv_gastos, "w", newline="", encoding="utf-8") as archivo:
-                    writer = csv.writer(archivo)
-                    writer.writerow(["Fecha", "Categoria", "Descripcion", "Monto_ARS"])
-                logger.info(f"Created new expense file: {self.csv_gastos}")
-            
             # Add new expense record
-            fecha = datetime.now().strftime("%Y-%m-%d")
+            fecha = _today_iso()
             nueva_fila = [fecha, category, description, amount]
             
-            with open(self.csv_gastos, "a", newline="", encoding="utf-8") as archivo:
-                writer = csv.writer(archivo)
-                writer.writerow(nueva_fila)
+            self._append_csv_row(self.csv_gastos, ["Fecha", "Categoria", "Descripcion", "Monto_ARS"], nueva_fila)
             
             logger.info(f"Expense registered successfully: {fecha}, {category}, {amount}")
             
@@ -370,32 +516,38 @@ class DataManager:
                 error_code="CSV_WRITE_ERROR"
             )
     
-    def _register_investment_excel(self, asset: str, operation_type: str, amount: float) -> Result:
-        """Legacy method to register investment in Excel file."""
+    def _append_csv_row(self, file_path: str, header: List[str], row: List[Any]) -> None:
+        """
+        Append a row to a legacy CSV file with a single open() call.
+        The parent directory is only created when the open fails, and the
+        header is written when the file is empty.
+        """
         try:
-            # Ensure directory exists
-            if not os.path.exists(self.ruta_trackers):
-                os.makedirs(self.ruta_trackers)
-                logger.info(f"Created directory: {self.ruta_trackers}")
-            
-            fecha = datetime.now().strftime("%Y-%m-%d")
-            nueva_inversion = pd.DataFrame([{
-                "Fecha": fecha,
-                "Activo": asset,
-                "Tipo": operation_type,
-                "Monto_ARS": amount
-            }])
-            
-            # Check if file exists and append or create
-            if os.path.exists(self.xlsx_inversiones):
-                df_existente = pd.read_excel(self.xlsx_inversiones)
-                df_actualizado = pd.concat([df_existente, nueva_inversion], ignore_index=True)
-            else:
-                df_actualizado = nueva_inversion
-                logger.info(f"Creating new investment file: {self.xlsx_inversiones}")
+            archivo = open(file_path, "a", newline="", encoding="utf-8")
+        except FileNotFoundError:
+            directory = os.path.dirname(file_path)
+            os.makedirs(directory, exist_ok=True)
+            logger.info(f"Created directory: {directory}")
+            archivo = open(file_path, "a", newline="", encoding="utf-8")
+        
+        with archivo:
+            writer = csv.writer(archivo)
+            if archivo.tell() == 0:
+                writer.writerow(header)
+                logger.info(f"Created new file: {file_path}")
+            writer.writerow(row)
+    
+    def _register_investment_csv(self, asset: str, operation_type: str, amount: float) -> Result:
+        """
+        Legacy method to register investment in the append-only CSV sink.
+        Rows are merged into the Excel file on demand by export_investments_to_xlsx.
+        """
+        try:
+            # Add new investment record
+            fecha = _today_iso()
+            nueva_fila = [fecha, asset, operation_type, amount]
             
-            # Save updated DataFrame
-            df_actualizado.to_excel(self.xlsx_inversiones, index=False)
+            self._append_csv_row(self.csv_inversiones, ["Fecha", "Activo", "Tipo", "Monto_ARS"], nueva_fila)
             
             logger.info(f"Investment registered successfully: {fecha}, {asset}, {operation_type}, {amount}")
             
@@ -410,13 +562,83 @@ class DataManager:
                 }
             )
         except Exception as e:
-            logger.error(f"Error registering investment to Excel: {e}")
+            logger.error(f"Error registering investment to CSV: {e}")
             return Result(
                 success=False,
                 message=f"Error al registrar inversión: {str(e)}",
+                error_code="CSV_WRITE_ERROR"
+            )
+    
+    def export_investments_to_xlsx(self) -> Result:
+        """
+        Merge the legacy investment CSV sink into the Excel file.
+        The CSV sink is removed once its rows are written to the workbook.
+        
+        Returns:
+            Result object indicating success or failure
+        """
+        try:
+            if not os.path.isfile(self.csv_inversiones):
+                return Result(success=True, message="No hay inversiones pendientes de exportar")
+            
+            df = self._load_investments_dataframe()
+            df.to_excel(self.xlsx_inversiones, index=False)
+            os.remove(self.csv_inversiones)
+            
+            logger.info(f"Exported {len(df)} investments to {self.xlsx_inversiones}")
+            return Result(
+                success=True,
+                message=f"Inversiones exportadas a {self.xlsx_inversiones}",
+                data={"records": len(df)}
+            )
+        except Exception as e:
+            logger.error(f"Error exporting investments to Excel: {e}")
+            return Result(
+                success=False,
+                message=f"Error al exportar inversiones: {str(e)}",
                 error_code="EXCEL_WRITE_ERROR"
             )
     
+    def _get_cached_monthly_analysis_db(self, month: int, year: int) -> AnalysisResult:
+        """
+        Get SQLite monthly analysis, reusing a previous result for past months.
+        The cached entry is discarded when the database or budget file changes.
+        """
+        now = datetime.now()
+        if (month, year) == (now.month, now.year):
+            # The current month is still receiving registrations
+            return self._get_monthly_analysis_db(month, year)
+        
+        key = (month, year)
+        fingerprint = self._analysis_fingerprint()
+        cached = self._analysis_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            logger.debug(f"Using cached monthly analysis for {month}/{year}")
+            return cached[1]
+        
+        result = self._get_monthly_analysis_db(month, year)
+        if result.success:
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.pop(next(iter(self._analysis_cache)))
+            self._analysis_cache[key] = (fingerprint, result)
+        
+        return result
+    
+    def _analysis_fingerprint(self) -> Tuple:
+        """Return modification times of the files a monthly analysis depends on."""
+        fingerprint = []
+        db_path = self.db_manager.db_path
+        # In WAL mode committed writes land in the -wal file until checkpoint.
+        # SQLite creates an empty -wal on first read, which is not a change.
+        for path in (db_path, db_path + "-wal", self.json_presupuesto):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                fingerprint.append(None)
+                continue
+            fingerprint.append(stat.st_mtime_ns if stat.st_size else None)
+        return tuple(fingerprint)
+    
     def _get_monthly_analysis_db(self, month: int, year: int) -> AnalysisResult:
         """Get monthly analysis using SQLite database."""
         try:
@@ -479,14 +701,14 @@ class DataManager:
                 error_code="DB_ANALYSIS_ERROR"
             )
     
-    def _get_monthly_analysis_files(self, month: int, year: int) -> AnalysisResult:
+    def _get_monthly_analysis_files(self, month: int, year: int, include_records: bool = False) -> AnalysisResult:
         """Get monthly analysis using legacy CSV/Excel files."""
         try:
             # Load and analyze expenses
-            expenses_data = self._load_and_analyze_expenses(month, year)
+            expenses_data = self._load_and_analyze_expenses(month, year, include_records)
             
             # Load and analyze investments
-            investments_data = self._load_and_analyze_investments(month, year)
+            investments_data = self._load_and_analyze_investments(month, year, include_records)
             
             # Load budget data if available
             budget_data = self._load_budget_data()
@@ -522,136 +744,124 @@ class DataManager:
     def _validate_expense_data(self, amount: float, category: str, description: str) -> Result:
         """Validate expense input data."""
         if amount <= 0:
-            return Result(
-                success=False,
-                message="El monto debe ser mayor a 0",
-                error_code="INVALID_AMOUNT"
-            )
+            return _INVALID_AMOUNT
         
         if not category or not category.strip():
-            return Result(
-                success=False,
-                message="La categoría es requerida",
-                error_code="MISSING_CATEGORY"
-            )
+            return _MISSING_CATEGORY
         
         if not description or not description.strip():
-            return Result(
-                success=False,
-                message="La descripción es requerida",
-                error_code="MISSING_DESCRIPTION"
-            )
+            return _MISSING_DESCRIPTION
         
         # Check for reasonable limits
         if amount > 1000000:  # 1 million ARS
-            return Result(
-                success=False,
-                message="El monto parece excesivamente alto. Verifique el valor",
-                error_code="AMOUNT_TOO_HIGH"
-            )
+            return _AMOUNT_TOO_HIGH
         
-        return Result(success=True, message="Datos válidos")
+        return _VALID_DATA
     
     def _validate_investment_data(self, asset: str, operation_type: str, amount: float) -> Result:
         """Validate investment input data."""
         if amount <= 0:
-            return Result(
-                success=False,
-                message="El monto debe ser mayor a 0",
-                error_code="INVALID_AMOUNT"
-            )
+            return _INVALID_AMOUNT
         
         if not asset or not asset.strip():
-            return Result(
-                success=False,
-                message="El activo es requerido",
-                error_code="MISSING_ASSET"
-            )
+            return _MISSING_ASSET
         
-        if operation_type not in ['Compra', 'Venta']:
-            return Result(
-                success=False,
-                message="El tipo de operación debe ser 'Compra' o 'Venta'",
-                error_code="INVALID_OPERATION_TYPE"
-            )
+        if operation_type not in _VALID_OP_TYPES:
+            return _INVALID_OPERATION_TYPE
         
-        return Result(success=True, message="Datos válidos")
+        return _VALID_DATA
     
-    def _load_and_analyze_expenses(self, month: int, year: int) -> Dict[str, Any]:
-        """Load and analyze expenses for a specific month."""
+    def _load_and_analyze_expenses(self, month: int, year: int, include_records: bool = False) -> Dict[str, Any]:
+        """
+        Load and analyze expenses for a specific month.
+        Individual rows are only collected when include_records is True.
+        """
         try:
             if not os.path.exists(self.csv_gastos):
                 logger.warning(f"Expenses file not found: {self.csv_gastos}")
                 return {"total": 0, "by_category": {}, "records": []}
             
-            df = pd.read_csv(self.csv_gastos)
-            if df.empty:
+            prefix = f"{year}-{month:02d}"
+            by_category = defaultdict(float)
+            total = 0.0
+            count = 0
+            skipped = 0
+            records = []
+            
+            with open(self.csv_gastos, 'r', newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    fecha = row.get('Fecha') or ''
+                    if not fecha.startswith(prefix):
+                        continue
+                    
+                    # Skip rows with invalid dates within the month
+                    try:
+                        datetime.strptime(fecha[:10], "%Y-%m-%d")
+                    except ValueError:
+                        continue
+                    
+                    # Skip rows with empty or malformed amounts
+                    try:
+                        monto = float(row.get('Monto_ARS') or '')
+                    except ValueError:
+                        skipped += 1
+                        continue
+                    if monto != monto:  # NaN
+                        skipped += 1
+                        continue
+                    
+                    by_category[row['Categoria']] += monto
+                    total += monto
+                    count += 1
+                    if include_records:
+                        records.append({**row, 'Monto_ARS': monto})
+            
+            if skipped:
+                logger.warning(f"Skipping {skipped} expense rows with invalid amount")
+            
+            if not count:
                 return {"total": 0, "by_category": {}, "records": []}
             
-            # Convert date column
-            df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-            df = df.dropna(subset=['Fecha'])
-            
-            # Filter by month and year
-            mask = (df['Fecha'].dt.month == month) & (df['Fecha'].dt.year == year)
-            df_month = df[mask]
-            
-            if df_month.empty:
-                return {"total": 0, "by_category": {}, "records": []}
-            
-            # Calculate totals by category
-            by_category = df_month.groupby('Categoria')['Monto_ARS'].sum().to_dict()
-            total = df_month['Monto_ARS'].sum()
-            
-            # Get individual records
-            records = df_month.to_dict('records')
-            
             return {
-                "total": float(total),
-                "by_category": {k: float(v) for k, v in by_category.items()},
+                "total": total,
+                "by_category": dict(by_category),
                 "records": records,
-                "count": len(df_month)
+                "count": count
             }
             
         except Exception as e:
             logger.error(f"Error loading expenses data: {e}")
             return {"total": 0, "by_category": {}, "records": [], "error": str(e)}
     
-    def _load_and_analyze_investments(self, month: int, year: int) -> Dict[str, Any]:
-        """Load and analyze investments for a specific month."""
+    def _load_and_analyze_investments(self, month: int, year: int, include_records: bool = False) -> Dict[str, Any]:
+        """
+        Load and analyze investments for a specific month.
+        Individual rows are only collected when include_records is True.
+        """
         try:
-            if not os.path.exists(self.xlsx_inversiones):
+            if not os.path.exists(self.xlsx_inversiones) and not os.path.isfile(self.csv_inversiones):
                 logger.warning(f"Investments file not found: {self.xlsx_inversiones}")
                 return {"total": 0, "by_asset": {}, "records": []}
             
-            df = pd.read_excel(self.xlsx_inversiones)
+            df = self._load_investments_dataframe()
             if df.empty:
                 return {"total": 0, "by_asset": {}, "records": []}
             
-            # Convert date column
-            df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-            df = df.dropna(subset=['Fecha'])
-            
-            # Filter by month and year
-            mask = (df['Fecha'].dt.month == month) & (df['Fecha'].dt.year == year)
-            df_month = df[mask]
+            df_month = self._filter_month(df, month, year)
             
             if df_month.empty:
                 return {"total": 0, "by_asset": {}, "records": []}
             
-            # Separate purchases and sales
-            compras = df_month[df_month['Tipo'].str.lower() == 'compra']
-            ventas = df_month[df_month['Tipo'].str.lower() == 'venta']
-            
-            # Calculate totals
-            total_compras = compras['Monto_ARS'].sum() if not compras.empty else 0
-            total_ventas = ventas['Monto_ARS'].sum() if not ventas.empty else 0
+            # Calculate purchase and sale totals in a single grouped pass
+            totals_by_type = df_month.groupby(df_month['Tipo'].str.lower(), sort=False)['Monto_ARS'].sum()
+            total_compras = totals_by_type.get('compra', 0)
+            total_ventas = totals_by_type.get('venta', 0)
             
             # Group by asset
             by_asset = df_month.groupby('Activo')['Monto_ARS'].sum().to_dict()
             
             # Get individual records
-            records = df_month.to_dict('records')
+            records = df_month.to_dict('records') if include_records else []
             
             return {
                 "total": float(total_compras),  # Total purchases for the month
@@ -666,6 +876,46 @@ class DataManager:
             logger.error(f"Error loading investments data: {e}")
             return {"total": 0, "by_asset": {}, "records": [], "error": str(e)}
     
+    def _filter_month(self, df: 'pd.DataFrame', month: int, year: int) -> 'pd.DataFrame':
+        """
+        Keep only the rows of df whose 'Fecha' falls in the given month.
+        ISO 'YYYY-MM-DD' strings are pre-filtered by prefix so that only the
+        month's rows go through date parsing; invalid dates are dropped.
+        """
+        import pandas as pd
+        
+        fechas = df['Fecha']
+        if not pd.api.types.is_datetime64_any_dtype(fechas):
+            df = df[fechas.astype(str).str.startswith(f"{year}-{month:02d}")]
+        
+        # Convert date column; dates are always written in ISO format
+        df = df.assign(Fecha=pd.to_datetime(df['Fecha'], format='ISO8601', errors='coerce', cache=True))
+        df = df.dropna(subset=['Fecha'])
+        
+        # Filter by month and year
+        mask = (df['Fecha'].dt.month == month) & (df['Fecha'].dt.year == year)
+        return df[mask]
+    
+    def _load_investments_dataframe(self) -> 'pd.DataFrame':
+        """Load legacy investments from the Excel file plus the CSV sink."""
+        import pandas as pd
+        
+        frames = []
+        if os.path.exists(self.xlsx_inversiones):
+            frames.append(pd.read_excel(self.xlsx_inversiones, engine=EXCEL_ENGINE))
+        if os.path.isfile(self.csv_inversiones):
+            frames.append(pd.read_csv(self.csv_inversiones))
+        
+        if not frames:
+            return pd.DataFrame(columns=["Fecha", "Activo", "Tipo", "Monto_ARS"])
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        
+        # Tipo holds a handful of distinct values; as a categorical, unique()
+        # and the .str/groupby operations work on the categories, not every row
+        if 'Tipo' in df.columns:
+            df['Tipo'] = df['Tipo'].astype('category')
+        return df
+    
     def _load_budget_data(self) -> Dict[str, Any]:
         """Load budget configuration data."""
         try:
@@ -673,10 +923,12 @@ class DataManager:
                 logger.warning(f"Budget file not found: {self.json_presupuesto}")
                 return {}
             
-            with open(self.json_presupuesto, 'r', encoding='utf-8') as f:
-                budget_data = json.load(f)
+            budget_data = _read_budget_cached(
+                self.json_presupuesto, os.path.getmtime(self.json_presupuesto)
+            )
             
-            return budget_data
+            # The parsed data is shared through the cache; hand out a copy
+            return copy.deepcopy(budget_data)
             
         except Exception as e:
             logger.error(f"Error loading budget data: {e}")
@@ -692,27 +944,29 @@ class DataManager:
                     error_code="FILE_NOT_FOUND"
                 )
             
-            df = pd.read_csv(self.csv_gastos)
             required_columns = ['Fecha', 'Categoria', 'Descripcion', 'Monto_ARS']
             
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                return Result(
-                    success=False,
-                    message=f"Columnas faltantes en archivo de gastos: {missing_columns}",
-                    error_code="MISSING_COLUMNS"
-                )
-            
-            # Check for data type issues
-            if not df.empty:
-                # Check if amounts are numeric
-                non_numeric_amounts = df[~pd.to_numeric(df['Monto_ARS'], errors='coerce').notna()]
-                if not non_numeric_amounts.empty:
+            with open(self.csv_gastos, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                header = reader.fieldnames or []
+                
+                missing_columns = [col for col in required_columns if col not in header]
+                if missing_columns:
                     return Result(
                         success=False,
-                        message=f"Montos no numéricos encontrados en {len(non_numeric_amounts)} registros",
-                        error_code="INVALID_AMOUNTS"
+                        message=f"Columnas faltantes en archivo de gastos: {missing_columns}",
+                        error_code="MISSING_COLUMNS"
                     )
+                
+                # Check if amounts are numeric
+                invalid_amounts = sum(1 for row in reader if not _is_number(row['Monto_ARS']))
+            
+            if invalid_amounts:
+                return Result(
+                    success=False,
+                    message=f"Montos no numéricos encontrados en {invalid_amounts} registros",
+                    error_code="INVALID_AMOUNTS"
+                )
             
             return Result(success=True, message="Archivo de gastos válido")
             
@@ -726,14 +980,14 @@ class DataManager:
     def _validate_investments_file(self) -> Result:
         """Validate investments Excel file structure and data."""
         try:
-            if not os.path.exists(self.xlsx_inversiones):
+            if not os.path.exists(self.xlsx_inversiones) and not os.path.isfile(self.csv_inversiones):
                 return Result(
                     success=False,
                     message="Archivo de inversiones no encontrado",
                     error_code="FILE_NOT_FOUND"
                 )
             
-            df = pd.read_excel(self.xlsx_inversiones)
+            df = self._load_investments_dataframe()
             required_columns = ['Fecha', 'Activo', 'Tipo', 'Monto_ARS']
             
             missing_columns = [col for col in required_columns if col not in df.columns]
@@ -746,12 +1000,12 @@ class DataManager:
             
             # Check for valid operation types
             if not df.empty:
-                valid_types = ['Compra', 'Venta']
-                invalid_types = df[~df['Tipo'].isin(valid_types)]
-                if not invalid_types.empty:
+                # Compare only the distinct values instead of masking every row
+                invalid_types = [tipo for tipo in df['Tipo'].unique() if tipo not in _VALID_OP_TYPES]
+                if invalid_types:
                     return Result(
                         success=False,
-                        message=f"Tipos de operación inválidos encontrados: {invalid_types['Tipo'].unique()}",
+                        message=f"Tipos de operación inválidos encontrados: {invalid_types}",
                         error_code="INVALID_OPERATION_TYPES"
                     )
             
@@ -774,8 +1028,10 @@ class DataManager:
                     error_code="FILE_NOT_FOUND"
                 )
             
-            with open(self.json_presupuesto, 'r', encoding='utf-8') as f:
-                budget_data = json.load(f)
+            # Shares the parsed data with _load_budget_data; unchanged files are not re-read
+            budget_data = _read_budget_cached(
+                self.json_presupuesto, os.path.getmtime(self.json_presupuesto)
+            )
             
             if not isinstance(budget_data, dict):
                 return Result(
@@ -7,10 +7,12 @@ Handles SQLite database operations and data migration.
 import sqlite3
 import os
 import csv
-import pandas as pd
+import threading
 from contextlib import contextmanager
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import islice
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from dataclasses import dataclass
 
 from .base import Result
@@ -19,6 +21,137 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Use the Rust-based calamine reader for Excel files when it is installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl)
+
+# Stored in PRAGMA user_version once the schema below has been applied
+SCHEMA_VERSION = 3
+
+# Rows per executemany batch when bulk-loading data
+BULK_INSERT_CHUNK_SIZE = 10000
+
+EXPENSE_COLUMNS = ('fecha', 'categoria', 'descripcion', 'monto_ars')
+INVESTMENT_COLUMNS = ('fecha', 'activo', 'tipo', 'monto_ars')
+
+# Mirrors the CHECK constraint on investments.tipo
+VALID_INVESTMENT_TYPES = frozenset(('Compra', 'Venta'))
+
+# Compiled statements kept per connection (sqlite3 default: 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every new connection. WAL makes synchronous=NORMAL safe
+# against corruption; a crash can only lose the last committed writes.
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA busy_timeout=5000',
+)
+
+# Statement texts shared by every call, so the connection's statement cache
+# reuses the compiled statements instead of parsing the SQL again
+_SQL_INSERT_EXPENSE = '''
+    INSERT INTO expenses (fecha, categoria, descripcion, monto_ars)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_INSERT_INVESTMENT = '''
+    INSERT INTO investments (fecha, activo, tipo, monto_ars)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_UPDATE_EXPENSE = '''
+    UPDATE expenses
+    SET fecha = ?, categoria = ?, descripcion = ?, monto_ars = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_INVESTMENT = '''
+    UPDATE investments
+    SET fecha = ?, activo = ?, tipo = ?, monto_ars = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+
+_SQL_SELECT_EXPENSES_MONTH = '''
+    SELECT id, fecha, categoria, descripcion, monto_ars, created_at
+    FROM expenses
+    WHERE fecha >= ? AND fecha < ?
+    ORDER BY fecha DESC, created_at DESC
+'''
+
+_SQL_SELECT_INVESTMENTS_MONTH = '''
+    SELECT id, fecha, activo, tipo, monto_ars, created_at
+    FROM investments
+    WHERE fecha >= ? AND fecha < ?
+    ORDER BY fecha DESC, created_at DESC
+'''
+
+_SQL_SELECT_EXPENSES_BY_CATEGORY = '''
+    SELECT categoria, SUM(monto_ars) as total, COUNT(*) as count
+    FROM expenses
+    WHERE fecha >= ? AND fecha < ?
+    GROUP BY categoria
+    ORDER BY total DESC
+'''
+
+_SQL_SELECT_MONTHLY_SUMMARY = '''
+    WITH bounds(start_date, end_date) AS (SELECT ?, ?)
+    SELECT e.total_expenses, e.expense_count,
+           i.total_purchases, i.total_sales, i.investment_count
+    FROM (
+        SELECT COALESCE(SUM(monto_ars), 0) as total_expenses, COUNT(*) as expense_count
+        FROM expenses, bounds
+        WHERE fecha >= start_date AND fecha < end_date
+    ) e, (
+        SELECT 
+            COALESCE(SUM(CASE WHEN tipo = 'Compra' THEN monto_ars ELSE 0 END), 0) as total_purchases,
+            COALESCE(SUM(CASE WHEN tipo = 'Venta' THEN monto_ars ELSE 0 END), 0) as total_sales,
+            COUNT(*) as investment_count
+        FROM investments, bounds
+        WHERE fecha >= start_date AND fecha < end_date
+    ) i
+'''
+
+# Secondary indexes, recreated after bulk loads
+INDEX_DEFINITIONS = {
+    # Covering indexes for the monthly range queries: the totals and the
+    # category/tipo breakdowns are answered without reading table rows
+    'idx_expenses_fecha_cat': 'expenses(fecha, categoria, monto_ars)',
+    'idx_expenses_categoria': 'expenses(categoria)',
+    'idx_investments_fecha_tipo': 'investments(fecha, tipo, monto_ars)',
+    'idx_investments_activo': 'investments(activo)',
+}
+
+# Superseded indexes dropped from existing databases
+OBSOLETE_INDEXES = (
+    'idx_expenses_ym',
+    'idx_investments_ym_tipo',
+    'idx_expenses_fecha',
+    'idx_investments_fecha',
+)
+
+
+@lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """
+    Return the [start, end) ISO dates of a month.
+    Range predicates on fecha can use the fecha-led indexes, unlike functions of the column.
+    Cached, so repeated queries for a month reuse the same bound strings.
+    """
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
+def legacy_investments_csv_path(xlsx_path: str) -> str:
+    """Return the append-only CSV sink that legacy mode writes next to the investments workbook."""
+    return os.path.splitext(xlsx_path)[0] + ".csv"
+
 
 @dataclass
 class DatabaseResult(Result):
@@ -31,6 +164,9 @@ class DatabaseManager:
     """
     SQLite database manager for PECO financial data.
     Handles database creation, migrations, and CRUD operations.
+    
+    The schema has no triggers: updated_at is only refreshed by update_expense
+    and update_investment, so every UPDATE of a row must go through them.
     """
     
     def __init__(self, db_path: str = "peco.db"):
@@ -41,109 +177,201 @@ class DatabaseManager:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
-        self.logger = get_logger(self.__class__.__name__)
-        self.init_database()
+        self._local = threading.local()
+        # Schema setup is deferred to the first connection (see _ensure_schema)
+        self._schema_ready = False
     
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections.
+        Each thread reuses one connection across calls; call close() to release it.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = None
+        conn = getattr(self._local, 'conn', None)
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+            if conn is None:
+                conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+                conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+                for pragma in CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+                self._local.conn = conn
+            if not self._schema_ready:
+                self._ensure_schema(conn)
             yield conn
         except Exception as e:
             if conn:
                 conn.rollback()
-            self.logger.error(f"Database connection error: {e}")
+            logger.error(f"Database connection error: {e}")
             raise DataError(f"Database connection failed: {str(e)}", "DB_CONNECTION_ERROR")
-        finally:
-            if conn:
-                conn.close()
+    
+    def close(self) -> None:
+        """Close the calling thread's database connection, if one is open."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
     
     def init_database(self) -> DatabaseResult:
         """
         Initialize the database with required tables.
+        Runs automatically on first use; call it to create the database eagerly.
         
         Returns:
             DatabaseResult: Result of database initialization
         """
         try:
-            self.logger.info(f"Initializing database at: {self.db_path}")
+            logger.info(f"Initializing database at: {self.db_path}")
             
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Create expenses table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS expenses (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        fecha DATE NOT NULL,
-                        categoria TEXT NOT NULL,
-                        descripcion TEXT NOT NULL,
-                        monto_ars REAL NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
+                self._ensure_schema(conn)
                 
-                # Create investments table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS investments (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        fecha DATE NOT NULL,
-                        activo TEXT NOT NULL,
-                        tipo TEXT NOT NULL CHECK (tipo IN ('Compra', 'Venta')),
-                        monto_ars REAL NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_expenses_fecha ON expenses(fecha)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_expenses_categoria ON expenses(categoria)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_investments_fecha ON investments(fecha)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_investments_activo ON investments(activo)')
-                
-                # Create trigger to update updated_at timestamp
-                cursor.execute('''
-                    CREATE TRIGGER IF NOT EXISTS update_expenses_timestamp 
-                    AFTER UPDATE ON expenses
-                    BEGIN
-                        UPDATE expenses SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-                    END
-                ''')
-                
-                cursor.execute('''
-                    CREATE TRIGGER IF NOT EXISTS update_investments_timestamp 
-                    AFTER UPDATE ON investments
-                    BEGIN
-                        UPDATE investments SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-                    END
-                ''')
-                
-                conn.commit()
-                
-            self.logger.info("Database initialized successfully")
+            logger.info("Database initialized successfully")
             return DatabaseResult(
                 success=True,
                 message="Database initialized successfully"
             )
             
         except Exception as e:
-            self.logger.error(f"Database initialization failed: {e}")
+            logger.error(f"Database initialization failed: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Database initialization failed: {str(e)}",
                 error_code="DB_INIT_ERROR"
             )
     
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Create or upgrade the schema unless PRAGMA user_version says it is current.
+        
+        Args:
+            conn: Open database connection
+        """
+        if conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION:
+            self._schema_ready = True
+            return
+        
+        cursor = conn.cursor()
+        
+        # Create expenses table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS expenses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fecha DATE NOT NULL,
+                categoria TEXT NOT NULL,
+                descripcion TEXT NOT NULL,
+                monto_ars REAL NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create investments table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS investments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fecha DATE NOT NULL,
+                activo TEXT NOT NULL,
+                tipo TEXT NOT NULL CHECK (tipo IN ('Compra', 'Venta')),
+                monto_ars REAL NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create indexes for better performance
+        self._create_indexes(cursor)
+        for name in OBSOLETE_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+        
+        # updated_at is set by the UPDATE statements themselves
+        cursor.execute('DROP TRIGGER IF EXISTS update_expenses_timestamp')
+        cursor.execute('DROP TRIGGER IF EXISTS update_investments_timestamp')
+        
+        # Refresh planner statistics for the (re)built indexes
+        cursor.execute('ANALYZE')
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        conn.commit()
+        
+        # Persistent setting, stored in the database file
+        conn.execute('PRAGMA journal_mode=WAL')
+        self._schema_ready = True
+        logger.info(f"Database schema ready (version {SCHEMA_VERSION})")
+    
+    def _create_indexes(self, cursor) -> None:
+        """Create any missing secondary index listed in INDEX_DEFINITIONS."""
+        for name, target in INDEX_DEFINITIONS.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+    
+    def _drop_indexes(self, cursor) -> None:
+        """Drop the secondary indexes so bulk loads skip per-row B-tree updates."""
+        for name in INDEX_DEFINITIONS:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+    
+    def quick_check(self) -> DatabaseResult:
+        """
+        Run SQLite's built-in consistency check (PRAGMA quick_check).
+        
+        Returns:
+            DatabaseResult: Success if the database reports 'ok', with the reported problems otherwise
+        """
+        try:
+            with self.get_connection() as conn:
+                problems = [row[0] for row in conn.execute('PRAGMA quick_check')]
+            
+            if problems == ['ok']:
+                return DatabaseResult(
+                    success=True,
+                    message="Integridad de base de datos verificada"
+                )
+            
+            logger.warning(f"Database quick_check reported problems: {problems}")
+            return DatabaseResult(
+                success=False,
+                message=f"Problemas de integridad: {'; '.join(problems)}",
+                data=problems,
+                error_code="DB_INTEGRITY_ERROR"
+            )
+            
+        except Exception as e:
+            logger.error(f"Database quick_check failed: {e}")
+            return DatabaseResult(
+                success=False,
+                message=f"Error verificando integridad: {str(e)}",
+                error_code="DB_INTEGRITY_ERROR"
+            )
+    
+    def _bulk_insert(self, conn: sqlite3.Connection, table: str, columns: Tuple[str, ...],
+                     rows: Iterable[Tuple], batch_size: int = BULK_INSERT_CHUNK_SIZE) -> int:
+        """
+        Insert rows into table with executemany, batch_size rows at a time.
+        Runs inside the caller's transaction; committing is left to the caller.
+        
+        Args:
+            conn: Open database connection
+            table: Target table name
+            columns: Column names matching each row tuple
+            rows: Iterable of row tuples, consumed lazily
+            batch_size: Rows per executemany call
+            
+        Returns:
+            int: Number of rows inserted
+        """
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        rows = iter(rows)
+        inserted = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return inserted
+            conn.executemany(sql, batch)
+            inserted += len(batch)
+    
     def add_expense(self, fecha: str, categoria: str, descripcion: str, monto_ars: float) -> DatabaseResult:
         """
         Add a new expense to the database.
@@ -160,15 +388,12 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO expenses (fecha, categoria, descripcion, monto_ars)
-                    VALUES (?, ?, ?, ?)
-                ''', (fecha, categoria, descripcion, monto_ars))
+                cursor.execute(_SQL_INSERT_EXPENSE, (fecha, categoria, descripcion, monto_ars))
                 
                 expense_id = cursor.lastrowid
                 conn.commit()
                 
-            self.logger.info(f"Expense added successfully with ID: {expense_id}")
+            logger.info(f"Expense added successfully with ID: {expense_id}")
             return DatabaseResult(
                 success=True,
                 message=f"Gasto registrado exitosamente (ID: {expense_id})",
@@ -177,7 +402,7 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to add expense: {e}")
+            logger.error(f"Failed to add expense: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error registrando gasto: {str(e)}",
@@ -198,24 +423,25 @@ class DatabaseManager:
             DatabaseResult: Result of the operation
         """
         try:
-            if tipo not in ['Compra', 'Venta']:
-                return DatabaseResult(
-                    success=False,
-                    message="Tipo debe ser 'Compra' o 'Venta'",
-                    error_code="INVALID_INVESTMENT_TYPE"
-                )
-            
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO investments (fecha, activo, tipo, monto_ars)
-                    VALUES (?, ?, ?, ?)
-                ''', (fecha, activo, tipo, monto_ars))
+                try:
+                    cursor.execute(_SQL_INSERT_INVESTMENT, (fecha, activo, tipo, monto_ars))
+                except sqlite3.IntegrityError as e:
+                    conn.rollback()
+                    # The tipo CHECK constraint rejects anything but 'Compra'/'Venta'
+                    if 'CHECK constraint' not in str(e):
+                        raise
+                    return DatabaseResult(
+                        success=False,
+                        message="Tipo debe ser 'Compra' o 'Venta'",
+                        error_code="INVALID_INVESTMENT_TYPE"
+                    )
                 
                 investment_id = cursor.lastrowid
                 conn.commit()
                 
-            self.logger.info(f"Investment added successfully with ID: {investment_id}")
+            logger.info(f"Investment added successfully with ID: {investment_id}")
             return DatabaseResult(
                 success=True,
                 message=f"Inversión registrada exitosamente (ID: {investment_id})",
@@ -224,13 +450,183 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to add investment: {e}")
+            logger.error(f"Failed to add investment: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error registrando inversión: {str(e)}",
                 error_code="INVESTMENT_INSERT_ERROR"
             )
     
+    def update_expense(self, expense_id: int, fecha: str, categoria: str, descripcion: str,
+                       monto_ars: float) -> DatabaseResult:
+        """
+        Update an existing expense and refresh its updated_at timestamp.
+        
+        Args:
+            expense_id: ID of the expense to update
+            fecha: Date in YYYY-MM-DD format
+            categoria: Expense category
+            descripcion: Expense description
+            monto_ars: Amount in ARS
+            
+        Returns:
+            DatabaseResult: Result of the operation
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_UPDATE_EXPENSE, (fecha, categoria, descripcion, monto_ars, expense_id))
+                updated = cursor.rowcount
+                conn.commit()
+            
+            if not updated:
+                return DatabaseResult(
+                    success=False,
+                    message=f"Gasto no encontrado (ID: {expense_id})",
+                    error_code="EXPENSE_NOT_FOUND"
+                )
+            
+            logger.info(f"Expense updated successfully with ID: {expense_id}")
+            return DatabaseResult(
+                success=True,
+                message=f"Gasto actualizado exitosamente (ID: {expense_id})",
+                data={'id': expense_id},
+                affected_rows=updated
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to update expense: {e}")
+            return DatabaseResult(
+                success=False,
+                message=f"Error actualizando gasto: {str(e)}",
+                error_code="EXPENSE_UPDATE_ERROR"
+            )
+    
+    def update_investment(self, investment_id: int, fecha: str, activo: str, tipo: str,
+                          monto_ars: float) -> DatabaseResult:
+        """
+        Update an existing investment and refresh its updated_at timestamp.
+        
+        Args:
+            investment_id: ID of the investment to update
+            fecha: Date in YYYY-MM-DD format
+            activo: Asset name
+            tipo: Transaction type ('Compra' or 'Venta')
+            monto_ars: Amount in ARS
+            
+        Returns:
+            DatabaseResult: Result of the operation
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(_SQL_UPDATE_INVESTMENT, (fecha, activo, tipo, monto_ars, investment_id))
+                except sqlite3.IntegrityError as e:
+                    conn.rollback()
+                    if 'CHECK constraint' not in str(e):
+                        raise
+                    return DatabaseResult(
+                        success=False,
+                        message="Tipo debe ser 'Compra' o 'Venta'",
+                        error_code="INVALID_INVESTMENT_TYPE"
+                    )
+                updated = cursor.rowcount
+                conn.commit()
+            
+            if not updated:
+                return DatabaseResult(
+                    success=False,
+                    message=f"Inversión no encontrada (ID: {investment_id})",
+                    error_code="INVESTMENT_NOT_FOUND"
+                )
+            
+            logger.info(f"Investment updated successfully with ID: {investment_id}")
+            return DatabaseResult(
+                success=True,
+                message=f"Inversión actualizada exitosamente (ID: {investment_id})",
+                data={'id': investment_id},
+                affected_rows=updated
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to update investment: {e}")
+            return DatabaseResult(
+                success=False,
+                message=f"Error actualizando inversión: {str(e)}",
+                error_code="INVESTMENT_UPDATE_ERROR"
+            )
+    
+    def add_expenses_bulk(self, rows: List[Tuple[str, str, str, float]]) -> DatabaseResult:
+        """
+        Add several expenses to the database in a single transaction.
+        
+        Args:
+            rows: List of (fecha, categoria, descripcion, monto_ars) tuples
+            
+        Returns:
+            DatabaseResult: Result of the operation
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute('BEGIN')
+                self._bulk_insert(conn, 'expenses', EXPENSE_COLUMNS, rows)
+                conn.commit()
+            
+            logger.info(f"Bulk expense insert completed: {len(rows)} rows")
+            return DatabaseResult(
+                success=True,
+                message=f"{len(rows)} gastos registrados exitosamente",
+                affected_rows=len(rows)
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to add expenses in bulk: {e}")
+            return DatabaseResult(
+                success=False,
+                message=f"Error registrando gastos: {str(e)}",
+                error_code="EXPENSE_BULK_INSERT_ERROR"
+            )
+    
+    def add_investments_bulk(self, rows: List[Tuple[str, str, str, float]]) -> DatabaseResult:
+        """
+        Add several investments to the database in a single transaction.
+        
+        Args:
+            rows: List of (fecha, activo, tipo, monto_ars) tuples
+            
+        Returns:
+            DatabaseResult: Result of the operation
+        """
+        try:
+            for row in rows:
+                if row[2] not in VALID_INVESTMENT_TYPES:
+                    return DatabaseResult(
+                        success=False,
+                        message="Tipo debe ser 'Compra' o 'Venta'",
+                        error_code="INVALID_INVESTMENT_TYPE"
+                    )
+            
+            with self.get_connection() as conn:
+                conn.execute('BEGIN')
+                self._bulk_insert(conn, 'investments', INVESTMENT_COLUMNS, rows)
+                conn.commit()
+            
+            logger.info(f"Bulk investment insert completed: {len(rows)} rows")
+            return DatabaseResult(
+                success=True,
+                message=f"{len(rows)} inversiones registradas exitosamente",
+                affected_rows=len(rows)
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to add investments in bulk: {e}")
+            return DatabaseResult(
+                success=False,
+                message=f"Error registrando inversiones: {str(e)}",
+                error_code="INVESTMENT_BULK_INSERT_ERROR"
+            )
+    
     def get_expenses_by_month(self, year: int, month: int) -> DatabaseResult:
         """
         Get all expenses for a specific month.
@@ -240,19 +636,15 @@ class DatabaseManager:
             month: Month (1-12)
             
         Returns:
-            DatabaseResult: Result with expenses data
+            DatabaseResult: Result with expenses data as sqlite3.Row objects
+                (accessible by column name, dict(row) for a plain dict)
         """
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, fecha, categoria, descripcion, monto_ars, created_at
-                    FROM expenses
-                    WHERE strftime('%Y', fecha) = ? AND strftime('%m', fecha) = ?
-                    ORDER BY fecha DESC, created_at DESC
-                ''', (str(year), f"{month:02d}"))
+                cursor.execute(_SQL_SELECT_EXPENSES_MONTH, _month_bounds(year, month))
                 
-                expenses = [dict(row) for row in cursor.fetchall()]
+                expenses = cursor.fetchall()
                 
             return DatabaseResult(
                 success=True,
@@ -261,7 +653,7 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to get expenses: {e}")
+            logger.error(f"Failed to get expenses: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error obteniendo gastos: {str(e)}",
@@ -277,19 +669,15 @@ class DatabaseManager:
             month: Month (1-12)
             
         Returns:
-            DatabaseResult: Result with investments data
+            DatabaseResult: Result with investments data as sqlite3.Row objects
+                (accessible by column name, dict(row) for a plain dict)
         """
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, fecha, activo, tipo, monto_ars, created_at
-                    FROM investments
-                    WHERE strftime('%Y', fecha) = ? AND strftime('%m', fecha) = ?
-                    ORDER BY fecha DESC, created_at DESC
-                ''', (str(year), f"{month:02d}"))
+                cursor.execute(_SQL_SELECT_INVESTMENTS_MONTH, _month_bounds(year, month))
                 
-                investments = [dict(row) for row in cursor.fetchall()]
+                investments = cursor.fetchall()
                 
             return DatabaseResult(
                 success=True,
@@ -298,7 +686,7 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to get investments: {e}")
+            logger.error(f"Failed to get investments: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error obteniendo inversiones: {str(e)}",
@@ -314,20 +702,15 @@ class DatabaseManager:
             month: Month (1-12)
             
         Returns:
-            DatabaseResult: Result with categorized expenses
+            DatabaseResult: Result with categorized expenses as sqlite3.Row objects
+                (accessible by column name, dict(row) for a plain dict)
         """
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT categoria, SUM(monto_ars) as total, COUNT(*) as count
-                    FROM expenses
-                    WHERE strftime('%Y', fecha) = ? AND strftime('%m', fecha) = ?
-                    GROUP BY categoria
-                    ORDER BY total DESC
-                ''', (str(year), f"{month:02d}"))
+                cursor.execute(_SQL_SELECT_EXPENSES_BY_CATEGORY, _month_bounds(year, month))
                 
-                categories = [dict(row) for row in cursor.fetchall()]
+                categories = cursor.fetchall()
                 
             return DatabaseResult(
                 success=True,
@@ -336,7 +719,7 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to get expenses by category: {e}")
+            logger.error(f"Failed to get expenses by category: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error obteniendo gastos por categoría: {str(e)}",
@@ -358,34 +741,19 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get total expenses
-                cursor.execute('''
-                    SELECT COALESCE(SUM(monto_ars), 0) as total_expenses, COUNT(*) as expense_count
-                    FROM expenses
-                    WHERE strftime('%Y', fecha) = ? AND strftime('%m', fecha) = ?
-                ''', (str(year), f"{month:02d}"))
-                expense_data = dict(cursor.fetchone())
-                
-                # Get total investments
-                cursor.execute('''
-                    SELECT 
-                        COALESCE(SUM(CASE WHEN tipo = 'Compra' THEN monto_ars ELSE 0 END), 0) as total_purchases,
-                        COALESCE(SUM(CASE WHEN tipo = 'Venta' THEN monto_ars ELSE 0 END), 0) as total_sales,
-                        COUNT(*) as investment_count
-                    FROM investments
-                    WHERE strftime('%Y', fecha) = ? AND strftime('%m', fecha) = ?
-                ''', (str(year), f"{month:02d}"))
-                investment_data = dict(cursor.fetchone())
+                # Expense and investment totals in a single round-trip
+                cursor.execute(_SQL_SELECT_MONTHLY_SUMMARY, _month_bounds(year, month))
+                totals = dict(cursor.fetchone())
                 
                 summary = {
                     'year': year,
                     'month': month,
-                    'total_expenses': expense_data['total_expenses'],
-                    'expense_count': expense_data['expense_count'],
-                    'total_purchases': investment_data['total_purchases'],
-                    'total_sales': investment_data['total_sales'],
-                    'net_investment': investment_data['total_purchases'] - investment_data['total_sales'],
-                    'investment_count': investment_data['investment_count']
+                    'total_expenses': totals['total_expenses'],
+                    'expense_count': totals['expense_count'],
+                    'total_purchases': totals['total_purchases'],
+                    'total_sales': totals['total_sales'],
+                    'net_investment': totals['total_purchases'] - totals['total_sales'],
+                    'investment_count': totals['investment_count']
                 }
                 
             return DatabaseResult(
@@ -395,67 +763,71 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to get monthly summary: {e}")
+            logger.error(f"Failed to get monthly summary: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error generando resumen mensual: {str(e)}",
                 error_code="SUMMARY_QUERY_ERROR"
             )
     
-    def migrate_from_csv_excel(self, csv_gastos_path: str, xlsx_inversiones_path: str) -> DatabaseResult:
+    def migrate_from_csv_excel(self, csv_gastos_path: str, xlsx_inversiones_path: str,
+                               csv_inversiones_path: Optional[str] = None) -> DatabaseResult:
         """
         Migrate data from existing CSV and Excel files to SQLite database.
         
         Args:
             csv_gastos_path: Path to expenses CSV file
             xlsx_inversiones_path: Path to investments Excel file
+            csv_inversiones_path: Path to the legacy investments CSV sink.
+                                  Defaults to the sink next to the Excel file.
             
         Returns:
             DatabaseResult: Result of migration operation
         """
+        if csv_inversiones_path is None:
+            csv_inversiones_path = legacy_investments_csv_path(xlsx_inversiones_path)
+        
         try:
             migrated_expenses = 0
             migrated_investments = 0
             
-            # Migrate expenses from CSV
-            if os.path.exists(csv_gastos_path):
-                self.logger.info(f"Migrating expenses from: {csv_gastos_path}")
-                with open(csv_gastos_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Map CSV columns to database columns
-                        fecha = row.get('Fecha', '')
-                        categoria = row.get('Categoria', '')
-                        descripcion = row.get('Descripcion', '')
-                        monto_str = row.get('Monto_ARS', '0')
-                        
-                        try:
-                            monto_ars = float(monto_str)
-                            result = self.add_expense(fecha, categoria, descripcion, monto_ars)
-                            if result.success:
-                                migrated_expenses += 1
-                        except ValueError:
-                            self.logger.warning(f"Skipping invalid expense row: {row}")
-            
-            # Migrate investments from Excel
-            if os.path.exists(xlsx_inversiones_path):
-                self.logger.info(f"Migrating investments from: {xlsx_inversiones_path}")
-                try:
-                    df = pd.read_excel(xlsx_inversiones_path)
-                    for _, row in df.iterrows():
-                        fecha = str(row.get('Fecha', ''))
-                        activo = str(row.get('Activo', ''))
-                        tipo = str(row.get('Tipo', ''))
-                        monto_ars = float(row.get('Monto_ARS', 0))
-                        
-                        result = self.add_investment(fecha, activo, tipo, monto_ars)
-                        if result.success:
-                            migrated_investments += 1
-                except Exception as e:
-                    self.logger.warning(f"Error reading Excel file: {e}")
+            # Load everything in one transaction on a single connection.
+            # Indexes are rebuilt once after the load instead of row by row.
+            with self.get_connection() as conn:
+                conn.execute('BEGIN')
+                self._drop_indexes(conn)
+                
+                # Migrate expenses from CSV
+                if os.path.exists(csv_gastos_path):
+                    logger.info(f"Migrating expenses from: {csv_gastos_path}")
+                    migrated_expenses = self._bulk_insert(
+                        conn, 'expenses', EXPENSE_COLUMNS, self._iter_expense_rows(csv_gastos_path)
+                    )
+                
+                # Migrate investments from Excel
+                if os.path.exists(xlsx_inversiones_path):
+                    logger.info(f"Migrating investments from: {xlsx_inversiones_path}")
+                    try:
+                        migrated_investments = self._bulk_insert(
+                            conn, 'investments', INVESTMENT_COLUMNS, self._read_investment_rows(xlsx_inversiones_path)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Error reading Excel file: {e}")
+                
+                # Migrate investments registered in legacy mode but not yet
+                # exported to the Excel file
+                if os.path.isfile(csv_inversiones_path):
+                    logger.info(f"Migrating investments from: {csv_inversiones_path}")
+                    migrated_investments += self._bulk_insert(
+                        conn, 'investments', INVESTMENT_COLUMNS, self._iter_investment_csv_rows(csv_inversiones_path)
+                    )
+                
+                self._create_indexes(conn)
+                conn.execute('ANALYZE')
+                conn.commit()
             
             message = f"Migración completada: {migrated_expenses} gastos, {migrated_investments} inversiones"
-            self.logger.info(message)
+            logger.info(message)
             
             return DatabaseResult(
                 success=True,
@@ -467,13 +839,132 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Migration failed: {e}")
+            logger.error(f"Migration failed: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error en migración: {str(e)}",
                 error_code="MIGRATION_ERROR"
             )
     
+    def _iter_expense_rows(self, csv_path: str):
+        """
+        Yield expense tuples from the legacy CSV, skipping invalid amounts.
+        The file is parsed by pandas' C reader in BULK_INSERT_CHUNK_SIZE chunks.
+        """
+        import pandas as pd
+        
+        columns = ['Fecha', 'Categoria', 'Descripcion', 'Monto_ARS']
+        try:
+            chunks = pd.read_csv(
+                csv_path,
+                usecols=lambda column: column in columns,
+                dtype=str,
+                keep_default_na=False,
+                chunksize=BULK_INSERT_CHUNK_SIZE
+            )
+            for chunk in chunks:
+                # Map CSV columns to database columns
+                chunk = chunk.reindex(columns=columns, fill_value='')
+                # Blank and non-numeric amounts coerce to NaN and are skipped
+                montos = pd.to_numeric(chunk['Monto_ARS'], errors='coerce')
+                valid = montos.notna()
+                skipped = int((~valid).sum())
+                if skipped:
+                    logger.warning(f"Skipping {skipped} expense rows with invalid amount")
+                
+                yield from zip(
+                    chunk['Fecha'][valid],
+                    chunk['Categoria'][valid],
+                    chunk['Descripcion'][valid],
+                    montos[valid].tolist()
+                )
+        except pd.errors.EmptyDataError:
+            return
+    
+    def _iter_investment_csv_rows(self, csv_path: str):
+        """Yield investment tuples from the legacy CSV sink, skipping invalid types and amounts."""
+        skipped = 0
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                tipo = row.get('Tipo') or ''
+                try:
+                    monto_ars = float(row.get('Monto_ARS') or '')
+                except ValueError:
+                    monto_ars = None
+                if tipo not in VALID_INVESTMENT_TYPES or monto_ars is None:
+                    skipped += 1
+                    continue
+                yield (row.get('Fecha') or '', row.get('Activo') or '', tipo, monto_ars)
+        
+        if skipped:
+            logger.warning(f"Skipping {skipped} investments with invalid type or amount")
+    
+    def _read_investment_rows(self, xlsx_path: str) -> List[Tuple[str, str, str, float]]:
+        """
+        Read investment tuples from the legacy Excel file, skipping invalid types and amounts.
+        Uses calamine through pandas when installed, otherwise streams the sheet
+        with openpyxl in read-only mode without building a DataFrame.
+        """
+        if EXCEL_ENGINE is None:
+            return self._read_investment_rows_openpyxl(xlsx_path)
+        
+        import pandas as pd
+        
+        df = pd.read_excel(xlsx_path, engine=EXCEL_ENGINE)
+        df = df.reindex(columns=['Fecha', 'Activo', 'Tipo', 'Monto_ARS'])
+        # Blank and non-numeric amounts coerce to NaN and are skipped
+        df['Monto_ARS'] = pd.to_numeric(df['Monto_ARS'], errors='coerce')
+        df = df.fillna({'Fecha': '', 'Activo': '', 'Tipo': ''})
+        
+        valid = df['Tipo'].isin(VALID_INVESTMENT_TYPES) & df['Monto_ARS'].notna()
+        skipped = int((~valid).sum())
+        if skipped:
+            logger.warning(f"Skipping {skipped} investments with invalid type or amount")
+        
+        return [
+            (str(fecha), str(activo), tipo, float(monto_ars))
+            for fecha, activo, tipo, monto_ars in df[valid].itertuples(index=False, name=None)
+        ]
+    
+    def _read_investment_rows_openpyxl(self, xlsx_path: str) -> List[Tuple[str, str, str, float]]:
+        """Read investment tuples row by row from a read-only openpyxl workbook."""
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            positions = {name: index for index, name in enumerate(header)}
+            
+            def column(row, name, default):
+                index = positions.get(name)
+                value = row[index] if index is not None and index < len(row) else None
+                return default if value is None else value
+            
+            investments = []
+            skipped = 0
+            for row in rows:
+                tipo = column(row, 'Tipo', '')
+                try:
+                    monto_ars = float(column(row, 'Monto_ARS', ''))
+                except (TypeError, ValueError):
+                    monto_ars = None
+                if tipo not in VALID_INVESTMENT_TYPES or monto_ars is None or monto_ars != monto_ars:
+                    skipped += 1
+                    continue
+                investments.append((
+                    str(column(row, 'Fecha', '')),
+                    str(column(row, 'Activo', '')),
+                    tipo,
+                    monto_ars
+                ))
+        finally:
+            workbook.close()
+        
+        if skipped:
+            logger.warning(f"Skipping {skipped} investments with invalid type or amount")
+        return investments
+    
     def backup_to_csv_excel(self, csv_path: str, xlsx_path: str) -> DatabaseResult:
         """
         Backup database data to CSV and Excel files.
@@ -486,36 +977,49 @@ class DatabaseManager:
             DatabaseResult: Result of backup operation
         """
         try:
+            # Rows are streamed in chunks so memory stays bounded by the chunk size
+            expenses_backed_up = 0
+            investments_backed_up = 0
+            
             # Backup expenses to CSV
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT fecha, categoria, descripcion, monto_ars FROM expenses ORDER BY fecha')
-                expenses = cursor.fetchall()
                 
                 with open(csv_path, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
                     writer.writerow(['Fecha', 'Categoria', 'Descripcion', 'Monto_ARS'])
-                    for expense in expenses:
-                        writer.writerow(expense)
+                    while True:
+                        rows = cursor.fetchmany(BULK_INSERT_CHUNK_SIZE)
+                        if not rows:
+                            break
+                        writer.writerows(rows)
+                        expenses_backed_up += len(rows)
                 
                 # Backup investments to Excel
                 cursor.execute('SELECT fecha, activo, tipo, monto_ars FROM investments ORDER BY fecha')
-                investments = cursor.fetchall()
                 
-                df = pd.DataFrame(investments, columns=['Fecha', 'Activo', 'Tipo', 'Monto_ARS'])
-                df.to_excel(xlsx_path, index=False, sheet_name='Inversiones')
+                from openpyxl import Workbook
+                
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet('Inversiones')
+                sheet.append(['Fecha', 'Activo', 'Tipo', 'Monto_ARS'])
+                for row in cursor:
+                    sheet.append(tuple(row))
+                    investments_backed_up += 1
+                workbook.save(xlsx_path)
             
             return DatabaseResult(
                 success=True,
-                message=f"Backup completado: {len(expenses)} gastos, {len(investments)} inversiones",
+                message=f"Backup completado: {expenses_backed_up} gastos, {investments_backed_up} inversiones",
                 data={
-                    'expenses_backed_up': len(expenses),
-                    'investments_backed_up': len(investments)
+                    'expenses_backed_up': expenses_backed_up,
+                    'investments_backed_up': investments_backed_up
                 }
             )
             
         except Exception as e:
-            self.logger.error(f"Backup failed: {e}")
+            logger.error(f"Backup failed: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error en backup: {str(e)}",
@@ -533,12 +1037,14 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get table counts
-                cursor.execute('SELECT COUNT(*) FROM expenses')
-                expense_count = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT COUNT(*) FROM investments')
-                investment_count = cursor.fetchone()[0]
+                # Row counts from the highest AUTOINCREMENT id: a single B-tree
+                # lookup per table. Exact as long as rows are never deleted,
+                # which no code path in the application does.
+                cursor.execute('''
+                    SELECT (SELECT COALESCE(MAX(rowid), 0) FROM expenses),
+                           (SELECT COALESCE(MAX(rowid), 0) FROM investments)
+                ''')
+                expense_count, investment_count = cursor.fetchone()
                 
                 # Get database file size
                 db_size = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
@@ -559,7 +1065,7 @@ class DatabaseManager:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to get database stats: {e}")
+            logger.error(f"Failed to get database stats: {e}")
             return DatabaseResult(
                 success=False,
                 message=f"Error obteniendo estadísticas: {str(e)}",
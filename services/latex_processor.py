@@ -5,12 +5,21 @@ Handles character escaping and template processing for safe LaTeX compilation.
 """
 
 import re
+import logging
+from functools import lru_cache
 from typing import Dict, Optional
 from .exceptions import LaTeXError
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Currency amounts like $1,234.56 or $1234
+_CURRENCY_RE = re.compile(r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+# Unescaped characters that break LaTeX compilation: a single dollar sign
+# (not part of $$) or any of % & # _ { }, not preceded by a backslash
+_UNESCAPED_RE = re.compile(r'(?<!\\)(?:\$(?!\$)|[%&#_{}])')
+
 
 class LaTeXProcessor:
     """
@@ -40,9 +49,14 @@ class LaTeXProcessor:
         '>': r'\textgreater{}'
     }
     
+    # Characters that need escaping; text without any of them is returned as-is
+    _SPECIAL_CHARS = frozenset(LATEX_ESCAPE_MAP)
+    
+    # Translation table for str.translate (every key is a single character)
+    _LATEX_TRANS = str.maketrans(LATEX_ESCAPE_MAP)
+    
     def __init__(self):
-        """Initialize the LaTeX processor."""
-        logger.debug("LaTeX processor initialized")
+        """Initialize the LaTeX processor. All lookup tables are shared class attributes."""
     
     def escape_special_characters(self, text: str) -> str:
         """
@@ -67,34 +81,17 @@ class LaTeXProcessor:
                 details={'input_type': type(text).__name__, 'input_value': str(text)}
             )
         
-        if not text:
+        if not text or self._SPECIAL_CHARS.isdisjoint(text):
             return text
         
         try:
-            logger.debug(f"Escaping special characters in text: {text[:50]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Escaping special characters in text: {text[:50]}...")
             
-            # Use a placeholder for backslash to avoid double-escaping
-            BACKSLASH_PLACEHOLDER = "XBACKSLASHX"
+            escaped_text = _escape_cached(text)
             
-            escaped_text = text
-            
-            # Replace backslashes with placeholder first
-            if '\\' in escaped_text:
-                escaped_text = escaped_text.replace('\\', BACKSLASH_PLACEHOLDER)
-                logger.debug(f"Replaced '\\' with placeholder")
-            
-            # Process all other characters (excluding backslash)
-            for char, replacement in self.LATEX_ESCAPE_MAP.items():
-                if char != '\\' and char in escaped_text:
-                    escaped_text = escaped_text.replace(char, replacement)
-                    logger.debug(f"Replaced '{char}' with '{replacement}'")
-            
-            # Finally replace placeholder with proper backslash escape
-            if BACKSLASH_PLACEHOLDER in escaped_text:
-                escaped_text = escaped_text.replace(BACKSLASH_PLACEHOLDER, r'\textbackslash{}')
-                logger.debug(f"Replaced placeholder with '\\textbackslash{{}}'")
-            
-            logger.debug(f"Character escaping completed. Result: {escaped_text[:50]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Character escaping completed. Result: {escaped_text[:50]}...")
             return escaped_text
             
         except Exception as e:
@@ -110,6 +107,10 @@ class LaTeXProcessor:
         
         This method handles common currency patterns like "$1,234.56" and ensures
         they are properly formatted for LaTeX while maintaining readability.
+        Only a '$' followed by an amount is escaped; a bare '$' is left as-is.
+        
+        Not needed before or after process_description/escape_special_characters,
+        which already escape every '$'. Kept for callers that escape amounts only.
         
         Args:
             text: Text containing currency amounts
@@ -117,19 +118,13 @@ class LaTeXProcessor:
         Returns:
             Text with currency amounts properly escaped
         """
-        if not text:
+        if not text or '$' not in text:
             return text
         
         try:
-            # Pattern to match currency amounts like $1,234.56 or $1234
-            currency_pattern = r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-            
-            def replace_currency(match):
-                amount = match.group(1)
-                return f'\\${amount}'
-            
-            result = re.sub(currency_pattern, replace_currency, text)
-            logger.debug(f"Currency escaping: '{text}' -> '{result}'")
+            result = _CURRENCY_RE.sub(r'\\$\1', text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Currency escaping: '{text}' -> '{result}'")
             return result
             
         except Exception as e:
@@ -156,12 +151,11 @@ class LaTeXProcessor:
             return ""
         
         try:
-            logger.debug(f"Processing description: {description}")
-            
             # Use general character escaping which handles all special characters including $
             processed = self.escape_special_characters(description)
             
-            logger.debug(f"Description processing completed: {processed}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Description processed: {description!r} -> {processed!r}")
             return processed
             
         except Exception as e:
@@ -187,20 +181,21 @@ class LaTeXProcessor:
         if not text:
             return True
         
-        # Check for unescaped problematic characters
-        problematic_patterns = [
-            r'(?<!\\)\$(?!\$)',  # Unescaped single dollar signs
-            r'(?<!\\)%',         # Unescaped percent signs
-            r'(?<!\\)&',         # Unescaped ampersands
-            r'(?<!\\)#',         # Unescaped hash symbols
-            r'(?<!\\)_',         # Unescaped underscores
-            r'(?<!\\)\{',        # Unescaped opening braces
-            r'(?<!\\)\}',        # Unescaped closing braces
-        ]
-        
-        for pattern in problematic_patterns:
-            if re.search(pattern, text):
-                logger.warning(f"Found potentially problematic pattern in text: {pattern}")
-                return False
+        match = _UNESCAPED_RE.search(text)
+        if match:
+            logger.warning(f"Found unescaped character in text: {match.group(0)!r}")
+            return False
         
-        return True
\ No newline at end of file
+        return True
+
+
+@lru_cache(maxsize=4096)
+def _escape_cached(text: str) -> str:
+    """
+    Escape text with LaTeXProcessor's translation table.
+    Descriptions and categories repeat across reports, so results are memoized;
+    call _escape_cached.cache_clear() if LATEX_ESCAPE_MAP is ever changed.
+    """
+    # One C-level pass over the input: replacements are never rescanned,
+    # so the backslashes they introduce cannot be escaped a second time
+    return text.translate(LaTeXProcessor._LATEX_TRANS)
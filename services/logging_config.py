@@ -7,15 +7,26 @@ Provides centralized logging setup with file and console handlers.
 import logging
 import logging.handlers
 import os
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Set
+
+# Log directories already created by this process
+_created_log_dirs: Set[str] = set()
+
+
+@lru_cache(maxsize=1)
+def _log_file_stamp(day: date) -> str:
+    """Format the default log file date stamp, cached for the current day."""
+    return day.strftime("%Y%m%d")
 
 
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
     max_file_size: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    enable_file: bool = True
 ) -> logging.Logger:
     """
     Set up comprehensive logging configuration for the PECO application.
@@ -25,24 +36,31 @@ def setup_logging(
         log_file: Path to log file. If None, uses default location
         max_file_size: Maximum size of log file before rotation (bytes)
         backup_count: Number of backup log files to keep
+        enable_file: Whether to log to a file; False logs to the console only
         
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    logs_dir = os.path.join(os.getcwd(), "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    
-    # Set default log file if not provided
-    if log_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d")
+    if not enable_file:
+        log_file = None
+    elif log_file is None:
+        # Create logs directory if it doesn't exist (once per process)
+        logs_dir = os.path.join(os.getcwd(), "logs")
+        if logs_dir not in _created_log_dirs:
+            os.makedirs(logs_dir, exist_ok=True)
+            _created_log_dirs.add(logs_dir)
+        
+        # Set default log file
+        timestamp = _log_file_stamp(date.today())
         log_file = os.path.join(logs_dir, f"peco_{timestamp}.log")
     
     # Configure root logger
     logger = logging.getLogger("peco")
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear any existing handlers
+    # Clear any existing handlers, closing their open log files
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # Create formatter
@@ -52,18 +70,19 @@ def setup_logging(
     )
     
     # File handler with rotation
-    try:
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_file_size,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    except (OSError, IOError) as e:
-        print(f"Warning: Could not create file handler for logging: {e}")
+    if log_file is not None:
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_file_size,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+        except (OSError, IOError) as e:
+            print(f"Warning: Could not create file handler for logging: {e}")
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -77,7 +96,7 @@ def setup_logging(
     logger.addHandler(console_handler)
     
     # Log initial setup message
-    logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
+    logger.info("Logging initialized - Level: %s, File: %s", log_level, log_file)
     
     return logger
 
@@ -93,7 +112,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(f"peco.{name}")
-
-
-# Create default logger instance
-default_logger = get_logger("main")
\ No newline at end of file
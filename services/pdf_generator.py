@@ -5,13 +5,16 @@ Handles LaTeX compilation, template processing, and PDF generation with comprehe
 """
 
 import os
+import re
 import subprocess
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound, TemplateError
 
 from .exceptions import LaTeXError, ConfigurationError
 from .latex_processor import LaTeXProcessor
@@ -19,6 +22,40 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on pdflatex runs for documents whose cross-references need settling
+MAX_LATEX_PASSES = 3
+
+# pdflatex log messages asking for another run to resolve references
+_RERUN_RE = re.compile(r'Rerun to get|Rerun LaTeX|Label\(s\) may have changed')
+
+# Number of trailing pdflatex output lines kept in compilation results and logs
+LATEX_LOG_TAIL_LINES = 200
+
+
+def _trim_latex_output(output: Optional[str], tail_lines: int = LATEX_LOG_TAIL_LINES) -> Optional[str]:
+    """
+    Reduce pdflatex output to its error lines plus the last lines of the run.
+    
+    Args:
+        output: Captured pdflatex output
+        tail_lines: Number of trailing lines to keep
+        
+    Returns:
+        The output unchanged if it is short, otherwise the lines starting with
+        '!' (LaTeX errors) that precede the tail, followed by the tail
+    """
+    if not output:
+        return output
+    
+    lines = output.splitlines()
+    if len(lines) <= tail_lines:
+        return output
+    
+    head = lines[:-tail_lines]
+    errors = [line for line in head if line.startswith('!')]
+    omitted = len(head) - len(errors)
+    return '\n'.join(errors + [f"... ({omitted} lines omitted) ..."] + lines[-tail_lines:])
+
 
 @dataclass
 class PDFResult:
@@ -53,21 +90,120 @@ class PDFGenerator:
     - Automatic cleanup of temporary files
     """
     
-    def __init__(self, latex_processor: Optional[LaTeXProcessor] = None):
+    def __init__(self, latex_processor: Optional[LaTeXProcessor] = None, keep_logs: bool = True):
         """
         Initialize PDF generator.
         
         Args:
             latex_processor: LaTeX processor instance for character escaping.
                            If None, creates a new instance.
+            keep_logs: Capture pdflatex output into compilation results. When False
+                       the output is discarded and only the .log file on disk is used.
         """
         self.latex_processor = latex_processor or LaTeXProcessor()
+        self.keep_logs = keep_logs
+        # Jinja2 environments keyed by template directory, so templates are
+        # compiled once and reused across renders
+        self._jinja_envs: Dict[str, Environment] = {}
+        # Memoized pdflatex availability; None until the first check
+        self._latex_available: Optional[bool] = None
+        # Serializes resource copies when resolutions are generated concurrently
+        self._resource_lock = threading.Lock()
+        # Output directories already validated by ensure_directory_structure
+        self._validated_dirs: set = set()
         logger.debug("PDF generator initialized")
     
-    def check_latex_availability(self) -> bool:
+    def _get_jinja_env(self, template_dir: str) -> Environment:
+        """
+        Get the cached Jinja2 environment for a template directory.
+        
+        Args:
+            template_dir: Directory the templates are loaded from
+            
+        Returns:
+            Environment whose template cache persists across calls
+        """
+        env = self._jinja_envs.get(template_dir)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                cache_size=400,
+                bytecode_cache=self._get_bytecode_cache()
+            )
+            self._jinja_envs[template_dir] = env
+        return env
+    
+    def precompile_templates(self, template_dir: str, patterns: tuple = ('*.tex.j2', '*.tex')) -> int:
+        """
+        Compile the templates in a directory ahead of time to warm the caches.
+        
+        Moves template compilation out of the first generation request. Files
+        that are not valid Jinja2 templates are skipped.
+        
+        Args:
+            template_dir: Directory containing the templates
+            patterns: Glob patterns selecting template files
+            
+        Returns:
+            Number of templates compiled
+        """
+        if not os.path.isdir(template_dir):
+            logger.debug(f"Template directory not found, nothing to precompile: {template_dir}")
+            return 0
+        
+        env = self._get_jinja_env(template_dir)
+        template_names = sorted({
+            path.relative_to(template_dir).as_posix()
+            for pattern in patterns
+            for path in Path(template_dir).glob(pattern)
+        })
+        
+        compiled = 0
+        for template_name in template_names:
+            try:
+                env.get_template(template_name)
+                compiled += 1
+            except TemplateError as e:
+                logger.debug(f"Skipping template that failed to compile {template_name}: {e}")
+        
+        logger.debug(f"Precompiled {compiled} templates from {template_dir}")
+        return compiled
+    
+    def _get_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        """
+        Create the on-disk bytecode cache so new processes skip template compilation.
+        
+        Returns:
+            Bytecode cache in Jinja's per-user temp directory, or None if it cannot be created
+        """
+        try:
+            return FileSystemBytecodeCache(pattern='__peco_jinja2_%s.cache')
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Jinja2 bytecode cache unavailable, templates will be compiled in memory: {e}")
+            return None
+    
+    def check_latex_availability(self, refresh: bool = False) -> bool:
         """
         Check if pdflatex is available on the system.
         
+        A positive result is memoized per instance so repeated compilations do
+        not spawn ``pdflatex --version`` each time. A negative result is probed
+        again on the next call, so installing LaTeX does not require a restart.
+        
+        Args:
+            refresh: Probe pdflatex again instead of using the memoized result
+        
+        Returns:
+            True if pdflatex is available, False otherwise
+        """
+        if refresh or not self._latex_available:
+            self._latex_available = self._probe_latex()
+        return self._latex_available
+    
+    def _probe_latex(self) -> bool:
+        """
+        Run ``pdflatex --version`` to find out whether pdflatex works.
+        
         Returns:
             True if pdflatex is available, False otherwise
         """
@@ -135,18 +271,34 @@ class PDFGenerator:
             logger.info(f"Compiling LaTeX file: {tex_file}")
             logger.debug(f"Output directory: {output_dir}")
             
-            # Run pdflatex compilation with non-interactive mode
-            process = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', '-output-directory', output_dir, tex_file],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                timeout=60  # 60 second timeout
-            )
+            tex_basename = os.path.splitext(os.path.basename(tex_file))[0]
+            if self.keep_logs:
+                output_options = {'capture_output': True}
+            else:
+                output_options = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}
+            
+            # Run pdflatex in non-interactive mode, repeating only while the
+            # log reports unresolved cross-references
+            for pass_number in range(1, MAX_LATEX_PASSES + 1):
+                process = subprocess.run(
+                    ['pdflatex', '-interaction=nonstopmode', '-output-directory', output_dir, tex_file],
+                    text=True,
+                    encoding='utf-8',
+                    errors='ignore',
+                    timeout=60,  # 60 second timeout
+                    **output_options
+                )
+                if pass_number == MAX_LATEX_PASSES:
+                    break
+                if self.keep_logs:
+                    pass_log = process.stdout or ''
+                else:
+                    pass_log = self._read_latex_log(os.path.join(output_dir, f"{tex_basename}.log"))
+                if not _RERUN_RE.search(pass_log):
+                    break
+                logger.debug(f"pdflatex requested another pass ({pass_number + 1})")
             
             # Check if PDF was created
-            tex_basename = os.path.splitext(os.path.basename(tex_file))[0]
             expected_pdf = os.path.join(output_dir, f"{tex_basename}.pdf")
             pdf_created = os.path.exists(expected_pdf)
             
@@ -156,10 +308,14 @@ class PDFGenerator:
             # LaTeX can have warnings (return code 1) but still produce a valid PDF
             compilation_successful = pdf_created or process.returncode == 0
             
+            # Keep only the relevant part of potentially very long logs
+            stdout = _trim_latex_output(process.stdout) or ''
+            stderr = _trim_latex_output(process.stderr) or ''
+            
             result = CompilationResult(
                 success=compilation_successful,
-                stdout=process.stdout,
-                stderr=process.stderr,
+                stdout=stdout,
+                stderr=stderr,
                 return_code=process.returncode,
                 pdf_created=pdf_created
             )
@@ -168,8 +324,8 @@ class PDFGenerator:
                 logger.info(f"PDF compilation successful: {expected_pdf}")
             else:
                 logger.error(f"PDF compilation failed. Return code: {process.returncode}")
-                logger.error(f"Stdout: {process.stdout}")
-                logger.error(f"Stderr: {process.stderr}")
+                logger.error(f"Stdout: {stdout}")
+                logger.error(f"Stderr: {stderr}")
             
             return result
             
@@ -181,11 +337,29 @@ class PDFGenerator:
             )
         except Exception as e:
             logger.error(f"Error during LaTeX compilation: {e}")
+            # pdflatex may have been removed since it was probed; check again next time
+            self._latex_available = None
             raise LaTeXError(
                 f"LaTeX compilation failed: {str(e)}",
                 details={'tex_file': tex_file, 'error': str(e)}
             )    
 
+    def _read_latex_log(self, log_path: str) -> str:
+        """
+        Read the .log file pdflatex writes next to the PDF.
+        
+        Args:
+            log_path: Path to the pdflatex .log file
+            
+        Returns:
+            Log contents, or an empty string if it cannot be read
+        """
+        try:
+            with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+        except OSError:
+            return ''
+    
     def process_template(self, template_path: str, data: Dict[str, Any]) -> str:
         """
         Process Jinja2 template with LaTeX-safe data.
@@ -230,7 +404,7 @@ class PDFGenerator:
             template_dir = os.path.dirname(template_path) if os.path.dirname(template_path) else '.'
             template_name = os.path.basename(template_path)
             
-            env = Environment(loader=FileSystemLoader(template_dir))
+            env = self._get_jinja_env(template_dir)
             template = env.get_template(template_name)
             
             # Process data to escape special characters
@@ -347,7 +521,8 @@ class PDFGenerator:
             
             # Copy required resource files to output directory
             try:
-                resource_copy_result = self._copy_template_resources(template_path, output_dir)
+                with self._resource_lock:
+                    resource_copy_result = self._copy_template_resources(template_path, output_dir)
                 logger.debug(f"Resource copy result: {resource_copy_result}")
             except Exception as e:
                 logger.warning(f"Failed to copy some template resources: {e}")
@@ -356,8 +531,9 @@ class PDFGenerator:
             # Write .tex file
             tex_path = os.path.join(output_dir, f"{filename_base}.tex")
             try:
-                with open(tex_path, 'w', encoding='utf-8') as f:
-                    f.write(tex_content)
+                # Encode once and write the bytes in a single call
+                with open(tex_path, 'wb') as f:
+                    f.write(tex_content.encode('utf-8'))
                 logger.debug(f"LaTeX file written: {tex_path}")
             except Exception as e:
                 return PDFResult(
@@ -385,6 +561,9 @@ class PDFGenerator:
             if compilation_result.success:
                 logger.info(f"PDF generation successful: {pdf_path}")
                 
+                # Web-optimize the PDF when qpdf is installed
+                self._linearize_pdf(pdf_path)
+                
                 # Automatically clean temporary files after successful compilation
                 base_path = os.path.join(output_dir, filename_base)
                 cleanup_result = self.clean_temp_files(base_path)
@@ -424,6 +603,71 @@ class PDFGenerator:
                 details={'error': str(e)}
             )
     
+    def generate_resolutions(self, jobs: List[Dict[str, Any]],
+                             max_workers: Optional[int] = None) -> List[PDFResult]:
+        """
+        Generate several resolution PDFs concurrently.
+        
+        Each job runs generate_resolution in a worker thread, so one document's
+        template rendering overlaps with other documents' pdflatex processes.
+        
+        Args:
+            jobs: List of keyword argument dictionaries for generate_resolution
+                  (template_path, data, output_dir, filename_base)
+            max_workers: Maximum number of concurrent jobs. Defaults to the CPU count
+            
+        Returns:
+            List of PDFResult objects in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+        logger.info(f"Generating {len(jobs)} resolutions with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: self.generate_resolution(**job), jobs))
+    
+    def _linearize_pdf(self, pdf_path: str) -> bool:
+        """
+        Linearize a compiled PDF with qpdf for fast web viewing, if qpdf is installed.
+        
+        Failures are logged and leave the original PDF untouched.
+        
+        Args:
+            pdf_path: Path to the compiled PDF
+            
+        Returns:
+            True if the PDF was replaced by its optimized version, False otherwise
+        """
+        qpdf = shutil.which('qpdf')
+        if qpdf is None or not os.path.exists(pdf_path):
+            return False
+        
+        optimized_path = pdf_path + '.opt'
+        try:
+            process = subprocess.run(
+                [qpdf, '--linearize', '--object-streams=generate', pdf_path, optimized_path],
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+            # qpdf exits with 3 when it succeeded with warnings
+            if process.returncode in (0, 3) and os.path.exists(optimized_path):
+                os.replace(optimized_path, pdf_path)
+                logger.debug(f"PDF linearized with qpdf: {pdf_path}")
+                return True
+            logger.warning(f"qpdf could not optimize {pdf_path}: {process.stderr}")
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"qpdf optimization failed for {pdf_path}: {e}")
+        
+        if os.path.exists(optimized_path):
+            try:
+                os.remove(optimized_path)
+            except OSError:
+                pass
+        return False
+    
     def clean_temp_files(self, base_path: str, extensions: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Clean temporary files generated during LaTeX compilation.
@@ -484,6 +728,9 @@ class PDFGenerator:
         """
         Ensure that the output directory structure exists and is writable.
         
+        Successfully validated directories are remembered, so repeated
+        generations into the same directory skip the filesystem checks.
+        
         Args:
             output_dir: Directory path to validate and create if necessary
             
@@ -493,6 +740,9 @@ class PDFGenerator:
         Raises:
             ConfigurationError: If directory cannot be created or accessed
         """
+        if output_dir in self._validated_dirs:
+            return True
+        
         try:
             # Create directory if it doesn't exist
             if not os.path.exists(output_dir):
@@ -522,6 +772,7 @@ class PDFGenerator:
                 )
             
             logger.debug(f"Directory structure validated: {output_dir}")
+            self._validated_dirs.add(output_dir)
             return True
             
         except OSError as e:
@@ -571,9 +822,11 @@ class PDFGenerator:
             try:
                 if os.path.exists(source_path):
                     # Copy the file to the output directory
-                    shutil.copy2(source_path, dest_path)
+                    if self._fast_copy(source_path, dest_path):
+                        logger.debug(f"Copied resource file: {resource_file}")
+                    else:
+                        logger.debug(f"Resource file already up to date: {resource_file}")
                     copied_files.append(resource_file)
-                    logger.debug(f"Copied resource file: {resource_file}")
                 else:
                     missing_files.append(resource_file)
                     logger.debug(f"Resource file not found: {source_path}")
@@ -588,13 +841,16 @@ class PDFGenerator:
             resources_subdir = os.path.join(output_dir, "05_Templates_y_Recursos")
             os.makedirs(resources_subdir, exist_ok=True)
             
-            # Copy files to the subdirectory as well
+            # Copy files to the subdirectory as well, linking to the copy just
+            # staged in the output directory (same device) when there is one
             for resource_file in resource_files:
-                source_path = os.path.join(template_dir, resource_file)
+                if resource_file in copied_files:
+                    source_path = os.path.join(output_dir, resource_file)
+                else:
+                    source_path = os.path.join(template_dir, resource_file)
                 dest_path = os.path.join(resources_subdir, resource_file)
                 
-                if os.path.exists(source_path):
-                    shutil.copy2(source_path, dest_path)
+                if os.path.exists(source_path) and self._fast_copy(source_path, dest_path):
                     logger.debug(f"Copied resource file to subdirectory: {resource_file}")
                     
         except Exception as e:
@@ -620,6 +876,39 @@ class PDFGenerator:
         
         return result
     
+    def _fast_copy(self, source_path: str, dest_path: str) -> bool:
+        """
+        Make a resource file available at dest_path without redundant byte copies.
+        
+        Skips files that are already up to date, then tries a hard link and
+        falls back to a full copy (e.g. across devices or on filesystems
+        without link support).
+        
+        Args:
+            source_path: Resource file to copy
+            dest_path: Destination path
+            
+        Returns:
+            True if the destination was written, False if it was already up to date
+        """
+        try:
+            source_stat = os.stat(source_path)
+            dest_stat = os.stat(dest_path)
+            if (os.path.samestat(source_stat, dest_stat) or
+                    (dest_stat.st_size == source_stat.st_size and
+                     dest_stat.st_mtime >= source_stat.st_mtime)):
+                return False
+            # Outdated copy: remove it so it can be replaced by a link
+            os.remove(dest_path)
+        except OSError:
+            pass
+        
+        try:
+            os.link(source_path, dest_path)
+        except (OSError, NotImplementedError):
+            shutil.copy2(source_path, dest_path)
+        return True
+    
     def validate_file_permissions(self, file_path: str, required_permissions: str = 'rw') -> bool:
         """
         Validate file permissions for a given file path.
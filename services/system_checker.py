@@ -5,11 +5,15 @@ Validates required dependencies and system requirements.
 """
 
 import os
+import sys
+import platform
 import subprocess
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .base import Result
@@ -18,6 +22,16 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Default presupuesto_base.json content, matching the structure of the existing file
+_DEFAULT_PRESUPUESTO_JSON = json.dumps({
+    "Comida": 25000,
+    "Transporte": 8000,
+    "Ocio": 15000,
+    "Inversión": 50000,
+    "Cuota Celular": 42416,
+    "Regalos": 0
+}, indent=2, ensure_ascii=False)
+
 
 @dataclass
 class DependencyResult(Result):
@@ -58,6 +72,14 @@ class SystemChecker:
     def __init__(self):
         """Initialize the SystemChecker."""
         self.logger = get_logger(self.__class__.__name__)
+        # Memoized result of check_latex_installation
+        self._latex_cache: Optional[Result] = None
+        # Platform details, invariant for the life of the process
+        self._platform_info: Optional[Dict[str, str]] = None
+    
+    def invalidate_cache(self) -> None:
+        """Forget memoized dependency checks so the next check probes the system again."""
+        self._latex_cache = None
     
     def check_all_dependencies(self) -> DependencyResult:
         """
@@ -103,6 +125,20 @@ class SystemChecker:
         """
         Check if pdflatex is available in the system.
         
+        The result is memoized per instance, so startup validation spawns
+        ``pdflatex --version`` only once; use invalidate_cache() to re-check.
+        
+        Returns:
+            Result: Success if pdflatex is available, failure otherwise
+        """
+        if self._latex_cache is None:
+            self._latex_cache = self._probe_latex_installation()
+        return self._latex_cache
+    
+    def _probe_latex_installation(self) -> Result:
+        """
+        Locate pdflatex in PATH and run it to verify it works.
+        
         Returns:
             Result: Success if pdflatex is available, failure otherwise
         """
@@ -112,9 +148,11 @@ class SystemChecker:
             if pdflatex_path:
                 self.logger.info(f"pdflatex found at: {pdflatex_path}")
                 
-                # Try to run pdflatex to verify it works
+                # Try to run pdflatex to verify it works, using the resolved path
+                # so the OS does not search PATH a second time
                 result = subprocess.run(
-                    ['pdflatex', '--version'],
+                    [pdflatex_path, '--version'],
+                    stdin=subprocess.DEVNULL,
                     capture_output=True,
                     text=True,
                     timeout=10
@@ -166,7 +204,6 @@ class SystemChecker:
             Result: Success if Python is available, failure otherwise
         """
         try:
-            import sys
             python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
             python_path = sys.executable
             
@@ -201,16 +238,18 @@ class SystemChecker:
         Returns:
             Dict[str, str]: System information
         """
-        import platform
-        import sys
+        if self._platform_info is None:
+            # platform.architecture() may spawn the 'file' command, so this
+            # is computed once per checker
+            self._platform_info = {
+                'platform': platform.system(),
+                'platform_version': platform.version(),
+                'architecture': platform.architecture()[0],
+                'python_version': platform.python_version(),
+                'python_executable': str(Path(sys.executable)),
+            }
         
-        info = {
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'architecture': platform.architecture()[0],
-            'python_version': platform.python_version(),
-            'python_executable': str(Path(sys.executable)),
-        }
+        info = dict(self._platform_info)
         
         # Add PATH information
         path_env = os.environ.get('PATH', '')
@@ -228,8 +267,6 @@ class SystemChecker:
         Returns:
             str: Installation instruction
         """
-        import platform
-        
         system = platform.system().lower()
         if system == 'darwin':
             system = 'macos'
@@ -298,25 +335,25 @@ class SystemChecker:
             config.RUTA_CONFIG_JSON: {
                 'description': 'Monthly configuration file',
                 'validator': self._validate_config_mes_json,
-                'default_content': self._get_default_config_mes(),
+                'default_factory': self._get_default_config_mes,
                 'required': True
             },
             config.JSON_PRESUPUESTO: {
                 'description': 'Base budget configuration file',
                 'validator': self._validate_presupuesto_json,
-                'default_content': self._get_default_presupuesto(),
+                'default_factory': self._get_default_presupuesto,
                 'required': True
             },
             config.CSV_GASTOS: {
                 'description': 'Monthly expenses CSV file',
                 'validator': self._validate_csv_structure,
-                'default_content': self._get_default_csv_header(),
+                'default_factory': self._get_default_csv_header,
                 'required': True
             },
             config.XLSX_INVERSIONES: {
                 'description': 'Investments Excel file',
                 'validator': self._validate_excel_structure,
-                'default_content': None,  # Special handling for Excel
+                'default_factory': None,  # Special handling for Excel
                 'required': True
             }
         }
@@ -326,7 +363,7 @@ class SystemChecker:
             os.path.join(config.RUTA_RECURSOS, config.NOMBRE_PLANTILLA_RESOLUCION): {
                 'description': 'LaTeX resolution template',
                 'validator': self._validate_latex_template,
-                'default_content': self._get_default_template(),
+                'default_factory': self._get_default_template,
                 'required': False  # Templates are not auto-created
             }
         }
@@ -339,7 +376,7 @@ class SystemChecker:
                     if file_path.endswith('.xlsx'):
                         self._create_default_excel_file(file_path)
                     else:
-                        self._create_file_with_content(file_path, file_info['default_content'])
+                        self._create_file_with_content(file_path, file_info['default_factory']())
                     created_files.append(file_path)
                     self.logger.info(f"Created {file_info['description']}: {file_path}")
                 except Exception as e:
@@ -426,7 +463,6 @@ class SystemChecker:
     
     def _get_default_config_mes(self) -> str:
         """Get default content for config_mes.json using the standardized schema."""
-        from datetime import datetime
         current_date = datetime.now()
         
         # Generate mes_iso in YYYY-MM format
@@ -467,17 +503,7 @@ class SystemChecker:
     
     def _get_default_presupuesto(self) -> str:
         """Get default content for presupuesto_base.json."""
-        # Match the actual structure used in the existing file
-        default_presupuesto = {
-            "Comida": 25000,
-            "Transporte": 8000,
-            "Ocio": 15000,
-            "Inversión": 50000,
-            "Cuota Celular": 42416,
-            "Regalos": 0
-        }
-        
-        return json.dumps(default_presupuesto, indent=2, ensure_ascii=False)
+        return _DEFAULT_PRESUPUESTO_JSON
     
     def _get_default_csv_header(self) -> str:
         """Get default CSV header for gastos_mensuales.csv."""
@@ -543,10 +569,12 @@ class SystemChecker:
             file_path: Path to the Excel file to create
         """
         try:
-            import pandas as pd
+            # openpyxl writes the header row directly, without building a DataFrame
+            from openpyxl import Workbook
             
-            # Create empty DataFrame with required columns
-            df = pd.DataFrame(columns=['Fecha', 'Activo', 'Tipo', 'Monto'])
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet(title='Inversiones')
+            sheet.append(['Fecha', 'Activo', 'Tipo', 'Monto'])
             
             # Ensure directory exists
             directory = os.path.dirname(file_path)
@@ -554,16 +582,33 @@ class SystemChecker:
                 os.makedirs(directory, exist_ok=True)
             
             # Save to Excel
-            df.to_excel(file_path, index=False, sheet_name='Inversiones')
+            workbook.save(file_path)
             
         except ImportError:
-            # If pandas is not available, create a simple CSV-like structure
-            self.logger.warning("pandas not available, creating simple Excel alternative")
+            # If openpyxl is not available, create a simple CSV-like structure
+            self.logger.warning("openpyxl not available, creating simple Excel alternative")
             content = "Fecha,Activo,Tipo,Monto\n"
             # Save as CSV with .xlsx extension (will be converted later if needed)
             with open(file_path.replace('.xlsx', '.csv'), 'w', encoding='utf-8') as f:
                 f.write(content)
     
+    def _check_dependencies_and_configuration(self) -> Tuple[DependencyResult, ConfigurationResult]:
+        """
+        Run the dependency checks and the configuration validation concurrently.
+        
+        The pdflatex probe waits on a subprocess, so it runs in a worker thread
+        while the configuration files are validated in the calling thread.
+        
+        Returns:
+            Tuple of (dependency result, configuration result)
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dependency_future = executor.submit(self.check_all_dependencies)
+            config_result = self.validate_configuration()
+            dependency_result = dependency_future.result()
+        
+        return dependency_result, config_result
+    
     def validate_startup_requirements(self) -> DependencyResult:
         """
         Validate all startup requirements and provide detailed feedback.
@@ -578,11 +623,8 @@ class SystemChecker:
         system_info = self.get_system_info()
         self.logger.info(f"System info: {system_info}")
         
-        # Check all dependencies
-        dependency_result = self.check_all_dependencies()
-        
-        # Check configuration
-        config_result = self.validate_configuration()
+        # Check dependencies and configuration
+        dependency_result, config_result = self._check_dependencies_and_configuration()
         
         # Combine results
         all_success = dependency_result.success and config_result.success
@@ -645,11 +687,8 @@ class SystemChecker:
         system_info = self.get_system_info()
         self.logger.info(f"System info: {system_info}")
         
-        # Check all dependencies
-        dependency_result = self.check_all_dependencies()
-        
-        # Check configuration regardless of dependency status
-        config_result = self.validate_configuration()
+        # Check dependencies and, regardless of their status, configuration
+        dependency_result, config_result = self._check_dependencies_and_configuration()
         
         # Combine results
         all_success = dependency_result.success and config_result.success
@@ -738,36 +777,6 @@ class SystemChecker:
         except Exception as e:
             self.logger.warning(f"Error validating config_mes.json structure: {e}")
             return False
-            
-            for field in required_fields:
-                if field not in config_data:
-                    self.logger.warning(f"Missing required field '{field}' in config_mes.json")
-                    return False
-            
-            # Validate gastos_mes_anterior structure
-            if isinstance(config_data['gastos_mes_anterior'], list):
-                for gasto in config_data['gastos_mes_anterior']:
-                    if not isinstance(gasto, dict) or 'descripcion' not in gasto or 'monto' not in gasto:
-                        self.logger.warning("Invalid structure in gastos_mes_anterior")
-                        return False
-            
-            # Validate lists
-            if not isinstance(config_data['considerandos_adicionales'], list):
-                self.logger.warning("considerandos_adicionales must be a list")
-                return False
-                
-            if not isinstance(config_data['articulos'], list):
-                self.logger.warning("articulos must be a list")
-                return False
-            
-            return True
-            
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"Invalid JSON in config_mes.json: {e}")
-            return False
-        except Exception as e:
-            self.logger.warning(f"Error validating config_mes.json: {e}")
-            return False
     
     def _validate_presupuesto_json(self, file_path: str) -> bool:
         """
@@ -622,7 +622,17 @@ class TestConfigurationHandling(unittest.TestCase):
         # Check MONTO_TOTAL replacement in articulos
         for articulo in processed_config["articulos"]:
             self.assertNotIn("$MONTO_TOTAL", articulo)
-    
+
+    def test_process_configuration_does_not_modify_input(self):
+        """Test template processing works on a copy of nested configuration data."""
+        result = self.validator.process_configuration_for_template(self.valid_config)
+
+        self.assertTrue(result.success)
+        self.assertIn("$MONTO_TOTAL", self.valid_config["articulos"][0])
+        self.assertNotIn("subtotal", self.valid_config["anexo"])
+        self.assertNotIn("codigo_res", self.valid_config)
+        self.assertIsNot(result.data["anexo"]["anexo_items"], self.valid_config["anexo"]["anexo_items"])
+
     def test_process_configuration_invalid_mes_iso(self):
         """Test template processing with invalid mes_iso."""
         config = self.valid_config.copy()
@@ -662,7 +672,49 @@ class TestConfigurationHandling(unittest.TestCase):
         self.assertIn("anexo_items", normalized_config["anexo"])
         self.assertNotIn("presupuesto", normalized_config["anexo"])
         self.assertEqual(len(normalized_config["anexo"]["anexo_items"]), 1)
-    
+
+    def test_normalize_configuration_structure_copy_flag(self):
+        """Test normalization leaves input intact by default and works in place with copy=False."""
+        config = {
+            "mes_iso": "2025-07",
+            "anexo": {"presupuesto": [{"categoria": "Test", "monto": "1000"}]}
+        }
+
+        result = self.validator.normalize_configuration_structure(config)
+
+        self.assertTrue(result.success)
+        self.assertIsNot(result.data, config)
+        self.assertIn("presupuesto", config["anexo"])
+        self.assertNotIn("anexo_items", config["anexo"])
+
+        result_in_place = self.validator.normalize_configuration_structure(config, copy=False)
+
+        self.assertTrue(result_in_place.success)
+        self.assertIs(result_in_place.data, config)
+        self.assertIn("anexo_items", config["anexo"])
+        self.assertNotIn("presupuesto", config["anexo"])
+
+    def test_normalize_configuration_structure_freeze(self):
+        """Test frozen normalization returns read-only data."""
+        config = {
+            "mes_iso": "2025-07",
+            "anexo": {"presupuesto": [{"categoria": "Test", "monto": "1000"}]}
+        }
+
+        result = self.validator.normalize_configuration_structure(config, freeze=True)
+
+        self.assertTrue(result.success)
+        frozen = result.data
+        self.assertEqual(frozen["anexo"]["anexo_items"][0]["categoria"], "Test")
+        self.assertIsInstance(frozen["anexo"]["anexo_items"], tuple)
+        with self.assertRaises(TypeError):
+            frozen["mes_iso"] = "2025-08"
+        with self.assertRaises(TypeError):
+            frozen["anexo"]["anexo_items"][0]["monto"] = "0"
+
+        # Original data must remain mutable and untouched
+        self.assertIn("presupuesto", config["anexo"])
+
     def test_month_name_generation(self):
         """Test month name generation for different months."""
         month_tests = [
@@ -100,16 +100,54 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result.data["tipo"], "Compra")
         self.assertEqual(result.data["monto"], 50000.0)
         
-        # Verify file was created
-        self.assertTrue(os.path.exists(self.mock_config.XLSX_INVERSIONES))
+        # Verify the append-only CSV sink was created
+        csv_inversiones = os.path.join(self.temp_dir, "inversiones.csv")
+        self.assertTrue(os.path.exists(csv_inversiones))
         
-        # Read and verify Excel file
-        df = pd.read_excel(self.mock_config.XLSX_INVERSIONES)
+        # Read and verify CSV sink
+        df = pd.read_csv(csv_inversiones)
         self.assertEqual(len(df), 1)
         self.assertEqual(df.iloc[0]["Activo"], "AAPL")
         self.assertEqual(df.iloc[0]["Tipo"], "Compra")
         self.assertEqual(df.iloc[0]["Monto_ARS"], 50000.0)
     
+    def test_register_expense_legacy_creates_directory_and_header_once(self):
+        """Test legacy expense registration creates the trackers directory and a single header."""
+        trackers = os.path.join(self.temp_dir, "trackers")
+        self.mock_config.RUTA_TRACKERS = trackers
+        self.mock_config.CSV_GASTOS = os.path.join(trackers, "gastos.csv")
+        data_manager = DataManager(self.mock_config, use_database=False)
+        
+        self.assertTrue(data_manager.register_expense(100.0, "Comida", "Almuerzo").success)
+        self.assertTrue(data_manager.register_expense(200.0, "Comida", "Cena").success)
+        
+        with open(self.mock_config.CSV_GASTOS, 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["Fecha", "Categoria", "Descripcion", "Monto_ARS"])
+        self.assertEqual(len(rows), 3)
+    
+    def test_register_investment_legacy_appends_and_exports(self):
+        """Test legacy investment registration appends to CSV and merges into Excel on export."""
+        data_manager = DataManager(self.mock_config, use_database=False)
+        pd.DataFrame([{"Fecha": "2025-07-01", "Activo": "MSFT", "Tipo": "Compra", "Monto_ARS": 1000.0}]).to_excel(
+            self.mock_config.XLSX_INVERSIONES, index=False
+        )
+        
+        self.assertTrue(data_manager.register_investment("AAPL", "Compra", 500.0).success)
+        self.assertTrue(data_manager.register_investment("AAPL", "Venta", 200.0).success)
+        
+        # Excel file is untouched by registrations; reads combine both sources
+        self.assertEqual(len(pd.read_excel(self.mock_config.XLSX_INVERSIONES)), 1)
+        self.assertEqual(len(data_manager._load_investments_dataframe()), 3)
+        
+        result = data_manager.export_investments_to_xlsx()
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["records"], 3)
+        self.assertFalse(os.path.exists(data_manager.csv_inversiones))
+        df = pd.read_excel(self.mock_config.XLSX_INVERSIONES)
+        self.assertEqual(list(df["Activo"]), ["MSFT", "AAPL", "AAPL"])
+    
     def test_register_investment_validation_errors(self):
         """Test investment registration validation errors."""
         # Test invalid amount
@@ -237,6 +275,47 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result["by_asset"], {})
         self.assertEqual(result["records"], [])
 
+    
+    def test_load_and_analyze_expenses_filters_month_and_invalid_dates(self):
+        """Test expense analysis keeps only valid dates of the requested month."""
+        with open(self.mock_config.CSV_GASTOS, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["Fecha", "Categoria", "Descripcion", "Monto_ARS"])
+            writer.writerow(["2025-07-01", "Comida", "Almuerzo", 100.0])
+            writer.writerow(["2025-07-99", "Comida", "Fecha inválida", 999.0])
+            writer.writerow(["2025-06-30", "Comida", "Mes anterior", 50.0])
+            writer.writerow(["2024-07-15", "Comida", "Año anterior", 70.0])
+        
+        result = self.data_manager._load_and_analyze_expenses(7, 2025)
+        self.assertEqual(result["total"], 100.0)
+        self.assertEqual(result["count"], 1)
+    
+    def test_load_and_analyze_expenses_records_are_opt_in(self):
+        """Test individual expense rows are only returned when requested."""
+        with open(self.mock_config.CSV_GASTOS, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["Fecha", "Categoria", "Descripcion", "Monto_ARS"])
+            writer.writerow(["2025-07-01", "Comida", "Almuerzo", 100.0])
+        
+        summary = self.data_manager._load_and_analyze_expenses(7, 2025)
+        detailed = self.data_manager._load_and_analyze_expenses(7, 2025, include_records=True)
+        
+        self.assertEqual(summary["records"], [])
+        self.assertEqual(summary["count"], 1)
+        self.assertEqual(detailed["records"][0]["Descripcion"], "Almuerzo")
+        self.assertEqual(detailed["records"][0]["Monto_ARS"], 100.0)
+    
+    def test_load_and_analyze_investments_with_excel_dates(self):
+        """Test investment analysis filters Excel date cells by month."""
+        df = pd.DataFrame([
+            {"Fecha": pd.Timestamp("2025-07-10"), "Activo": "AAPL", "Tipo": "Compra", "Monto_ARS": 1000.0},
+            {"Fecha": pd.Timestamp("2025-08-10"), "Activo": "AAPL", "Tipo": "Compra", "Monto_ARS": 500.0}
+        ])
+        df.to_excel(self.mock_config.XLSX_INVERSIONES, index=False)
+        
+        result = self.data_manager._load_and_analyze_investments(7, 2025)
+        self.assertEqual(result["total_compras"], 1000.0)
+        self.assertEqual(result["count"], 1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
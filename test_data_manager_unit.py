@@ -8,12 +8,15 @@ import unittest
 from unittest.mock import Mock, patch, mock_open, MagicMock
 import os
 import csv
+import shutil
+import tempfile
 import json
 import pandas as pd
 from datetime import datetime
 from io import StringIO
 
-from services.data_manager import DataManager
+from services.data_manager import DataManager, _read_budget_cached
+from services.database import DatabaseManager, INDEX_DEFINITIONS, SCHEMA_VERSION, legacy_investments_csv_path
 from services.base import Result, AnalysisResult
 from services.exceptions import DataError, ConfigurationError
 
@@ -34,6 +37,18 @@ class TestDataManager(unittest.TestCase):
         # Create DataManager instance with mock config
         self.data_manager = DataManager(config_module=self.mock_config)
     
+    def _make_temp_dir(self):
+        """Create a temporary directory that is removed when the test ends."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        return temp_dir
+    
+    def _use_temp_database(self):
+        """Point the DataManager at a fresh SQLite database in a temporary directory."""
+        db_manager = DatabaseManager(os.path.join(self._make_temp_dir(), "test.db"))
+        self.data_manager.db_manager = db_manager
+        return db_manager
+    
     def test_init_with_default_config(self):
         """Test DataManager initialization with default config."""
         # This test verifies that DataManager can be initialized without a config_module parameter
@@ -174,8 +189,8 @@ class TestDataManager(unittest.TestCase):
     
     @patch('services.data_manager.os.makedirs')
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_excel')
-    @patch('services.data_manager.pd.DataFrame.to_excel')
+    @patch('pandas.read_excel')
+    @patch('pandas.DataFrame.to_excel')
     def test_register_investment_success_new_file(self, mock_to_excel, mock_read_excel, mock_exists, mock_makedirs):
         """Test successful investment registration with new file creation."""
         # Setup mocks
@@ -197,9 +212,9 @@ class TestDataManager(unittest.TestCase):
     
     @patch('services.data_manager.os.makedirs')
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_excel')
-    @patch('services.data_manager.pd.DataFrame.to_excel')
-    @patch('services.data_manager.pd.concat')
+    @patch('pandas.read_excel')
+    @patch('pandas.DataFrame.to_excel')
+    @patch('pandas.concat')
     def test_register_investment_success_existing_file(self, mock_concat, mock_to_excel, mock_read_excel, mock_exists, mock_makedirs):
         """Test successful investment registration with existing file."""
         # Setup mocks
@@ -241,6 +256,321 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result.error_code, "INVALID_OPERATION_TYPE")
         self.assertIn("'Compra' o 'Venta'", result.message)
     
+    def test_register_expenses_bulk_inserts_all_rows(self):
+        """Test bulk expense registration inserts every row in one call."""
+        self._use_temp_database()
+        
+        rows = [
+            ("2025-01-10", "Comida", "Almuerzo", 1500.0),
+            ("2025-01-11", "Transporte", "Colectivo", 300.0),
+            ("2025-01-12", "Comida", "Cena", 2000.0)
+        ]
+        result = self.data_manager.register_expenses_bulk(rows)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.affected_rows, 3)
+        summary = self.data_manager.db_manager.get_monthly_summary(2025, 1).data
+        self.assertEqual(summary['expense_count'], 3)
+        self.assertEqual(summary['total_expenses'], 3800.0)
+        stats = self.data_manager.db_manager.get_database_stats().data
+        self.assertEqual(stats['total_expenses'], 3)
+        self.assertEqual(stats['total_records'], 3)
+    
+    def test_register_investments_bulk_rejects_invalid_row(self):
+        """Test bulk investment registration validates rows before inserting."""
+        self._use_temp_database()
+        
+        rows = [
+            ("2025-01-10", "AAPL", "Compra", 1000.0),
+            ("2025-01-11", "MSFT", "Hold", 500.0)
+        ]
+        result = self.data_manager.register_investments_bulk(rows)
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_code, "INVALID_OPERATION_TYPE")
+        self.assertIn("Fila 2", result.message)
+        summary = self.data_manager.db_manager.get_monthly_summary(2025, 1).data
+        self.assertEqual(summary['investment_count'], 0)
+        
+        # The shared validation result must not carry the row prefix
+        single = self.data_manager.register_investment("MSFT", "Hold", 500.0)
+        self.assertNotIn("Fila", single.message)
+    
+    def test_migrate_from_csv_excel_single_transaction(self):
+        """Test legacy migration loads valid rows and skips invalid ones."""
+        db_manager = self._use_temp_database()
+        temp_dir = os.path.dirname(db_manager.db_path)
+        csv_path = os.path.join(temp_dir, "gastos.csv")
+        xlsx_path = os.path.join(temp_dir, "inversiones.xlsx")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write("Fecha,Categoria,Descripcion,Monto_ARS\n"
+                    "2025-01-10,Comida,Almuerzo,1500.0\n"
+                    "2025-01-11,Transporte,Colectivo,abc\n"
+                    "2025-01-12,Comida,Cena,2000.0\n"
+                    "2025-01-13,Ocio,Sin monto,\n")
+        pd.DataFrame({
+            'Fecha': ['2025-01-05', '2025-01-06'],
+            'Activo': ['AAPL', 'MSFT'],
+            'Tipo': ['Compra', 'Hold'],
+            'Monto_ARS': [1000.0, 500.0]
+        }).to_excel(xlsx_path, index=False)
+        
+        result = db_manager.migrate_from_csv_excel(csv_path, xlsx_path)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, {'migrated_expenses': 2, 'migrated_investments': 1})
+        summary = db_manager.get_monthly_summary(2025, 1).data
+        self.assertEqual(summary['total_expenses'], 3500.0)
+        # The blank amount is skipped, not migrated as a 0.0 expense
+        self.assertEqual(summary['expense_count'], 2)
+        self.assertEqual(summary['total_purchases'], 1000.0)
+        
+        # Indexes dropped for the load are recreated afterwards
+        with db_manager.get_connection() as conn:
+            index_names = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            )}
+        self.assertEqual(index_names, set(INDEX_DEFINITIONS))
+        
+        # The pandas reader and the openpyxl streaming fallback agree
+        with patch('services.database.EXCEL_ENGINE', 'openpyxl'):
+            pandas_rows = db_manager._read_investment_rows(xlsx_path)
+        self.assertEqual(pandas_rows, db_manager._read_investment_rows_openpyxl(xlsx_path))
+    
+    def test_read_investment_rows_skips_blank_amounts(self):
+        """Test investments with a blank or non-numeric amount are skipped, not migrated as 0.0."""
+        db_manager = self._use_temp_database()
+        temp_dir = os.path.dirname(db_manager.db_path)
+        xlsx_path = os.path.join(temp_dir, "inversiones.xlsx")
+        pd.DataFrame({
+            'Fecha': ['2025-01-05', '2025-01-06', '2025-01-07', '2025-01-08'],
+            'Activo': ['AAPL', 'MSFT', 'GGAL', 'YPF'],
+            'Tipo': ['Compra', 'Compra', 'Venta', 'Hold'],
+            'Monto_ARS': [1000.0, None, 'abc', 500.0]
+        }).to_excel(xlsx_path, index=False)
+        
+        with patch('services.database.EXCEL_ENGINE', 'openpyxl'), \
+                self.assertLogs('peco.services.database', level='WARNING') as logs:
+            rows = db_manager._read_investment_rows(xlsx_path)
+        
+        self.assertEqual(rows, [('2025-01-05', 'AAPL', 'Compra', 1000.0)])
+        self.assertIn("Skipping 3 investments", logs.output[0])
+        
+        # The openpyxl streaming reader keeps the valid rows instead of raising
+        with self.assertLogs('peco.services.database', level='WARNING') as logs:
+            self.assertEqual(db_manager._read_investment_rows_openpyxl(xlsx_path), rows)
+        self.assertIn("Skipping 3 investments", logs.output[0])
+    
+    def test_migrate_from_csv_excel_includes_investment_csv_sink(self):
+        """Test migration also loads investments pending in the legacy CSV sink."""
+        db_manager = self._use_temp_database()
+        temp_dir = os.path.dirname(db_manager.db_path)
+        xlsx_path = os.path.join(temp_dir, "inversiones.xlsx")
+        pd.DataFrame({
+            'Fecha': ['2025-01-05'],
+            'Activo': ['AAPL'],
+            'Tipo': ['Compra'],
+            'Monto_ARS': [1000.0]
+        }).to_excel(xlsx_path, index=False)
+        
+        # Registered in legacy mode after the last export to Excel
+        legacy_manager = DataManager(config_module=self.mock_config, use_database=False)
+        legacy_manager.csv_inversiones = legacy_investments_csv_path(xlsx_path)
+        with patch('services.data_manager._today_iso', return_value='2025-01-20'):
+            legacy_manager.register_investment("MSFT", "Venta", 300.0)
+        
+        result = db_manager.migrate_from_csv_excel(os.path.join(temp_dir, "gastos.csv"), xlsx_path)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.data['migrated_investments'], 2)
+        summary = db_manager.get_monthly_summary(2025, 1).data
+        self.assertEqual(summary['total_purchases'], 1000.0)
+        self.assertEqual(summary['total_sales'], 300.0)
+    
+    def test_get_monthly_analysis_caches_past_months(self):
+        """Test past-month SQLite analysis is cached until data changes."""
+        self._use_temp_database()
+        self.data_manager.db_manager.init_database()
+        
+        with patch.object(self.data_manager, '_get_monthly_analysis_db',
+                          wraps=self.data_manager._get_monthly_analysis_db) as mock_analysis:
+            first = self.data_manager.get_monthly_analysis(1, 2024)
+            second = self.data_manager.get_monthly_analysis(1, 2024)
+            
+            self.assertTrue(first.success)
+            self.assertIs(first, second)
+            self.assertEqual(mock_analysis.call_count, 1)
+            
+            # Writing new data invalidates the cache
+            self.data_manager.register_expenses_bulk([("2024-01-15", "Comida", "Cena", 500.0)])
+            third = self.data_manager.get_monthly_analysis(1, 2024)
+            
+            self.assertEqual(mock_analysis.call_count, 2)
+            self.assertEqual(third.total_expenses, 500.0)
+    
+    def test_validate_data_integrity_fresh_database(self):
+        """Test integrity validation opens a not-yet-created database instead of reporting it missing."""
+        db_path = self._use_temp_database().db_path
+        
+        result = self.data_manager.validate_data_integrity()
+        
+        self.assertNotEqual(result.error_code, "DATABASE_NOT_FOUND")
+        self.assertTrue(os.path.exists(db_path))
+    
+    def test_data_managers_share_database_manager(self):
+        """Test DataManager instances reuse the process-wide DatabaseManager."""
+        other = DataManager(config_module=self.mock_config)
+        
+        self.assertIs(other.db_manager, self.data_manager.db_manager)
+    
+    def test_database_connection_pragmas(self):
+        """Test new databases use WAL and connections get the tuned pragmas."""
+        db_manager = self._use_temp_database()
+        
+        with db_manager.get_connection() as conn:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(conn.execute('PRAGMA synchronous').fetchone()[0], 1)  # NORMAL
+            self.assertEqual(conn.execute('PRAGMA busy_timeout').fetchone()[0], 5000)
+    
+    def test_database_connection_reused_per_thread(self):
+        """Test get_connection reuses the thread's connection until close()."""
+        db_manager = self._use_temp_database()
+        
+        with db_manager.get_connection() as first:
+            pass
+        with db_manager.get_connection() as second:
+            pass
+        self.assertIs(first, second)
+        
+        db_manager.close()
+        with db_manager.get_connection() as third:
+            self.assertIsNot(third, first)
+            self.assertEqual(third.execute('SELECT COUNT(*) FROM expenses').fetchone()[0], 0)
+        db_manager.close()
+    
+    def test_monthly_summary_month_boundaries(self):
+        """Test monthly queries include the whole month and nothing past it."""
+        db_manager = self._use_temp_database()
+        db_manager.add_expenses_bulk([
+            ("2024-11-30", "Comida", "Cena", 100.0),
+            ("2024-12-01", "Comida", "Almuerzo", 200.0),
+            ("2024-12-31 23:59:59", "Comida", "Cena", 300.0),
+            ("2025-01-01", "Comida", "Desayuno", 400.0)
+        ])
+        
+        december = db_manager.get_monthly_summary(2024, 12).data
+        january = db_manager.get_monthly_summary(2025, 1).data
+        
+        self.assertEqual(december['total_expenses'], 500.0)
+        self.assertEqual(december['expense_count'], 2)
+        self.assertEqual(january['total_expenses'], 400.0)
+        
+        expenses = db_manager.get_expenses_by_month(2024, 12).data
+        self.assertEqual([row['monto_ars'] for row in expenses], [300.0, 200.0])
+        categories = db_manager.get_expenses_by_category(2024, 12).data
+        self.assertEqual([dict(row) for row in categories], [{'categoria': 'Comida', 'total': 500.0, 'count': 2}])
+    
+    def test_add_investment_invalid_type_rejected_by_constraint(self):
+        """Test the tipo CHECK constraint is reported as an invalid type."""
+        db_manager = self._use_temp_database()
+        
+        result = db_manager.add_investment("2025-01-10", "AAPL", "Hold", 100.0)
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_code, "INVALID_INVESTMENT_TYPE")
+        self.assertTrue(db_manager.add_investment("2025-01-10", "AAPL", "Compra", 100.0).success)
+        self.assertEqual(db_manager.get_monthly_summary(2025, 1).data['investment_count'], 1)
+    
+    def test_backup_to_csv_excel_streams_all_rows(self):
+        """Test database backup writes every expense and investment."""
+        db_manager = self._use_temp_database()
+        temp_dir = os.path.dirname(db_manager.db_path)
+        db_manager.add_expenses_bulk([
+            ("2025-01-10", "Comida", "Almuerzo", 1500.0),
+            ("2025-01-11", "Transporte", "Colectivo", 300.0)
+        ])
+        db_manager.add_investments_bulk([("2025-01-05", "AAPL", "Compra", 1000.0)])
+        csv_path = os.path.join(temp_dir, "gastos.csv")
+        xlsx_path = os.path.join(temp_dir, "inversiones.xlsx")
+        
+        result = db_manager.backup_to_csv_excel(csv_path, xlsx_path)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, {'expenses_backed_up': 2, 'investments_backed_up': 1})
+        expenses = pd.read_csv(csv_path)
+        self.assertEqual(list(expenses.columns), ['Fecha', 'Categoria', 'Descripcion', 'Monto_ARS'])
+        self.assertEqual(expenses['Monto_ARS'].sum(), 1800.0)
+        investments = pd.read_excel(xlsx_path, sheet_name='Inversiones')
+        self.assertEqual(investments.to_dict('records'), [
+            {'Fecha': '2025-01-05', 'Activo': 'AAPL', 'Tipo': 'Compra', 'Monto_ARS': 1000.0}
+        ])
+    
+    def test_database_schema_created_on_first_use(self):
+        """Test schema setup is deferred to first use and recorded in user_version."""
+        db_manager = self._use_temp_database()
+        db_path = db_manager.db_path
+        
+        self.assertFalse(os.path.exists(db_path))
+        self.assertTrue(db_manager.add_expense("2025-01-10", "Comida", "Almuerzo", 1500.0).success)
+        
+        with db_manager.get_connection() as conn:
+            self.assertEqual(conn.execute('PRAGMA user_version').fetchone()[0], SCHEMA_VERSION)
+        db_manager.close()
+        
+        # A new manager finds the schema current and leaves it alone
+        reopened = DatabaseManager(db_path)
+        self.assertTrue(reopened.init_database().success)
+        self.assertEqual(reopened.get_monthly_summary(2025, 1).data['expense_count'], 1)
+        reopened.close()
+    
+    def test_update_expense_sets_updated_at(self):
+        """Test updates refresh updated_at without relying on triggers."""
+        db_manager = self._use_temp_database()
+        expense_id = db_manager.add_expense("2025-01-10", "Comida", "Almuerzo", 1500.0).data['id']
+        with db_manager.get_connection() as conn:
+            conn.execute("UPDATE expenses SET updated_at = '2000-01-01 00:00:00'")
+            conn.commit()
+            triggers = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'").fetchone()[0]
+        self.assertEqual(triggers, 0)
+        
+        result = db_manager.update_expense(expense_id, "2025-01-10", "Comida", "Almuerzo", 1800.0)
+        
+        self.assertTrue(result.success)
+        with db_manager.get_connection() as conn:
+            row = conn.execute('SELECT monto_ars, updated_at FROM expenses WHERE id = ?', (expense_id,)).fetchone()
+        self.assertEqual(row['monto_ars'], 1800.0)
+        self.assertNotEqual(row['updated_at'], '2000-01-01 00:00:00')
+        self.assertEqual(db_manager.update_expense(999, "2025-01-10", "Comida", "X", 1.0).error_code, "EXPENSE_NOT_FOUND")
+        investment_id = db_manager.add_investment("2025-01-10", "AAPL", "Compra", 100.0).data['id']
+        self.assertEqual(
+            db_manager.update_investment(investment_id, "2025-01-10", "AAPL", "Hold", 1.0).error_code,
+            "INVALID_INVESTMENT_TYPE"
+        )
+    
+    def test_update_investment_sets_updated_at(self):
+        """Test investment updates refresh updated_at without relying on triggers."""
+        db_manager = self._use_temp_database()
+        investment_id = db_manager.add_investment("2025-01-10", "AAPL", "Compra", 100.0).data['id']
+        with db_manager.get_connection() as conn:
+            conn.execute("UPDATE investments SET updated_at = '2000-01-01 00:00:00'")
+            conn.commit()
+        
+        result = db_manager.update_investment(investment_id, "2025-01-10", "AAPL", "Venta", 120.0)
+        
+        self.assertTrue(result.success)
+        with db_manager.get_connection() as conn:
+            row = conn.execute('SELECT tipo, updated_at FROM investments WHERE id = ?', (investment_id,)).fetchone()
+        self.assertEqual(row['tipo'], 'Venta')
+        self.assertNotEqual(row['updated_at'], '2000-01-01 00:00:00')
+    
+    def test_database_quick_check(self):
+        """Test SQLite quick_check reports a healthy database."""
+        db_manager = self._use_temp_database()
+        
+        result = db_manager.quick_check()
+        
+        self.assertTrue(result.success)
+    
     def test_get_monthly_analysis_invalid_month(self):
         """Test monthly analysis with invalid month."""
         result = self.data_manager.get_monthly_analysis(13, 2025)
@@ -285,8 +615,8 @@ class TestDataManager(unittest.TestCase):
         self.assertIn("analysis_data", result.__dict__)
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_csv')
-    def test_load_and_analyze_expenses_file_not_found(self, mock_read_csv, mock_exists):
+    @patch('builtins.open', new_callable=mock_open)
+    def test_load_and_analyze_expenses_file_not_found(self, mock_file, mock_exists):
         """Test expense analysis when file doesn't exist."""
         mock_exists.return_value = False
         
@@ -295,14 +625,13 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result["total"], 0)
         self.assertEqual(result["by_category"], {})
         self.assertEqual(result["records"], [])
-        mock_read_csv.assert_not_called()
+        mock_file.assert_not_called()
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_csv')
-    def test_load_and_analyze_expenses_empty_file(self, mock_read_csv, mock_exists):
+    @patch('builtins.open', new_callable=mock_open, read_data='')
+    def test_load_and_analyze_expenses_empty_file(self, mock_file, mock_exists):
         """Test expense analysis with empty file."""
         mock_exists.return_value = True
-        mock_read_csv.return_value = pd.DataFrame()  # Empty DataFrame
         
         result = self.data_manager._load_and_analyze_expenses(7, 2025)
         
@@ -311,20 +640,17 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result["records"], [])
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_csv')
-    def test_load_and_analyze_expenses_with_data(self, mock_read_csv, mock_exists):
+    @patch('builtins.open', new_callable=mock_open, read_data=(
+        "Fecha,Categoria,Descripcion,Monto_ARS\n"
+        "2025-07-15,Food,Lunch,500.0\n"
+        "2025-07-16,Transport,Bus,200.0\n"
+        "2025-07-17,Food,Dinner,800.0\n"
+        "2025-06-15,Food,Previous month,300.0\n"  # Different month
+    ))
+    def test_load_and_analyze_expenses_with_data(self, mock_file, mock_exists):
         """Test expense analysis with actual data."""
         mock_exists.return_value = True
         
-        # Create test DataFrame
-        test_data = pd.DataFrame([
-            {"Fecha": "2025-07-15", "Categoria": "Food", "Descripcion": "Lunch", "Monto_ARS": 500.0},
-            {"Fecha": "2025-07-16", "Categoria": "Transport", "Descripcion": "Bus", "Monto_ARS": 200.0},
-            {"Fecha": "2025-07-17", "Categoria": "Food", "Descripcion": "Dinner", "Monto_ARS": 800.0},
-            {"Fecha": "2025-06-15", "Categoria": "Food", "Descripcion": "Previous month", "Monto_ARS": 300.0}  # Different month
-        ])
-        mock_read_csv.return_value = test_data
-        
         result = self.data_manager._load_and_analyze_expenses(7, 2025)
         
         # Should only include July 2025 data
@@ -333,7 +659,28 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result["count"], 3)
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_excel')
+    @patch('builtins.open', new_callable=mock_open, read_data=(
+        "Fecha,Categoria,Descripcion,Monto_ARS\n"
+        "2025-07-15,Food,Lunch,500.0\n"
+        "2025-07-16,Transport,Bus,\n"  # Empty amount
+        "2025-07-17,Food,Dinner,abc\n"  # Malformed amount
+        "2025-07-18,Food,Snack,100.0\n"
+    ))
+    def test_load_and_analyze_expenses_skips_invalid_amounts(self, mock_file, mock_exists):
+        """Test expense analysis skips rows whose amount does not parse."""
+        mock_exists.return_value = True
+        
+        with self.assertLogs('peco.services.data_manager', level='WARNING') as logs:
+            result = self.data_manager._load_and_analyze_expenses(7, 2025)
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(result["total"], 600.0)
+        self.assertEqual(result["by_category"], {"Food": 600.0})
+        self.assertEqual(result["count"], 2)
+        self.assertIn("Skipping 2 expense rows", logs.output[0])
+    
+    @patch('services.data_manager.os.path.exists')
+    @patch('pandas.read_excel')
     def test_load_and_analyze_investments_with_data(self, mock_read_excel, mock_exists):
         """Test investment analysis with actual data."""
         mock_exists.return_value = True
@@ -356,11 +703,13 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result["by_asset"], {"AAPL": 1800.0, "GOOGL": 1500.0})  # 1000 + 800, 1500
         self.assertEqual(result["count"], 3)
     
+    @patch('services.data_manager.os.path.getmtime', return_value=1.0)
     @patch('services.data_manager.os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='{"monthly_limit": 2000.0, "categories": ["Food", "Transport"]}')
-    def test_load_budget_data_success(self, mock_file, mock_exists):
+    def test_load_budget_data_success(self, mock_file, mock_exists, mock_getmtime):
         """Test successful budget data loading."""
         mock_exists.return_value = True
+        _read_budget_cached.cache_clear()
         
         result = self.data_manager._load_budget_data()
         
@@ -376,6 +725,44 @@ class TestDataManager(unittest.TestCase):
         
         self.assertEqual(result, {})
     
+    def test_load_budget_data_cached_by_mtime(self):
+        """Test budget data is parsed once per file version and copied on return."""
+        temp_dir = self._make_temp_dir()
+        budget_path = os.path.join(temp_dir, "presupuesto.json")
+        with open(budget_path, 'w', encoding='utf-8') as f:
+            json.dump({"monthly_limit": 2000.0}, f)
+        self.data_manager.json_presupuesto = budget_path
+        _read_budget_cached.cache_clear()
+        
+        first = self.data_manager._load_budget_data()
+        first["monthly_limit"] = 0
+        second = self.data_manager._load_budget_data()
+        
+        self.assertEqual(second["monthly_limit"], 2000.0)
+        self.assertEqual(_read_budget_cached.cache_info().misses, 1)
+        
+        with open(budget_path, 'w', encoding='utf-8') as f:
+            json.dump({"monthly_limit": 3000.0}, f)
+        mtime = os.path.getmtime(budget_path) + 1
+        os.utime(budget_path, (mtime, mtime))
+        
+        self.assertEqual(self.data_manager._load_budget_data()["monthly_limit"], 3000.0)
+    
+    def test_validate_budget_file_reuses_parsed_budget(self):
+        """Test budget validation parses an unchanged file only once."""
+        temp_dir = self._make_temp_dir()
+        budget_path = os.path.join(temp_dir, "presupuesto.json")
+        with open(budget_path, 'w', encoding='utf-8') as f:
+            json.dump({"monthly_limit": 2000.0}, f)
+        self.data_manager.json_presupuesto = budget_path
+        _read_budget_cached.cache_clear()
+        
+        self.assertTrue(self.data_manager._validate_budget_file().success)
+        self.assertTrue(self.data_manager._validate_budget_file().success)
+        self.data_manager._load_budget_data()
+        
+        self.assertEqual(_read_budget_cached.cache_info().misses, 1)
+    
     @patch('services.data_manager.DataManager._validate_expenses_file')
     @patch('services.data_manager.DataManager._validate_investments_file')
     @patch('services.data_manager.DataManager._validate_budget_file')
@@ -415,12 +802,10 @@ class TestDataManager(unittest.TestCase):
         self.assertIn("Presupuesto: Budget file missing", result.data["issues"])
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_csv')
-    def test_validate_expenses_file_missing_columns(self, mock_read_csv, mock_exists):
+    @patch('builtins.open', new_callable=mock_open, read_data="Fecha,Monto\n2025-01-01,100.0\n")
+    def test_validate_expenses_file_missing_columns(self, mock_file, mock_exists):
         """Test expenses file validation with missing columns."""
         mock_exists.return_value = True
-        # DataFrame missing required columns
-        mock_read_csv.return_value = pd.DataFrame([{"Fecha": "2025-01-01", "Monto": 100.0}])
         
         result = self.data_manager._validate_expenses_file()
         
@@ -429,22 +814,22 @@ class TestDataManager(unittest.TestCase):
         self.assertIn("Columnas faltantes", result.message)
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_csv')
-    def test_validate_expenses_file_invalid_amounts(self, mock_read_csv, mock_exists):
+    @patch('builtins.open', new_callable=mock_open, read_data=(
+        "Fecha,Categoria,Descripcion,Monto_ARS\n"
+        "2025-01-01,Food,Lunch,invalid\n"
+        "2025-01-02,Transport,Bus,100.0\n"
+        "2025-01-03,Transport,Bus,\n"
+    ))
+    def test_validate_expenses_file_invalid_amounts(self, mock_file, mock_exists):
         """Test expenses file validation with invalid amounts."""
         mock_exists.return_value = True
-        # DataFrame with non-numeric amounts
-        test_data = pd.DataFrame([
-            {"Fecha": "2025-01-01", "Categoria": "Food", "Descripcion": "Lunch", "Monto_ARS": "invalid"},
-            {"Fecha": "2025-01-02", "Categoria": "Transport", "Descripcion": "Bus", "Monto_ARS": 100.0}
-        ])
-        mock_read_csv.return_value = test_data
         
         result = self.data_manager._validate_expenses_file()
         
         self.assertFalse(result.success)
         self.assertEqual(result.error_code, "INVALID_AMOUNTS")
         self.assertIn("no numéricos", result.message)
+        self.assertIn("2 registros", result.message)
     
     @patch('services.data_manager.os.path.exists')
     def test_validate_expenses_file_not_found(self, mock_exists):
@@ -457,7 +842,7 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result.error_code, "FILE_NOT_FOUND")
     
     @patch('services.data_manager.os.path.exists')
-    @patch('services.data_manager.pd.read_excel')
+    @patch('pandas.read_excel')
     def test_validate_investments_file_invalid_operation_types(self, mock_read_excel, mock_exists):
         """Test investments file validation with invalid operation types."""
         mock_exists.return_value = True
@@ -474,11 +859,13 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(result.error_code, "INVALID_OPERATION_TYPES")
         self.assertIn("inválidos", result.message)
     
+    @patch('services.data_manager.os.path.getmtime', return_value=1.0)
     @patch('services.data_manager.os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='invalid json')
-    def test_validate_budget_file_json_error(self, mock_file, mock_exists):
+    def test_validate_budget_file_json_error(self, mock_file, mock_exists, mock_getmtime):
         """Test budget file validation with JSON error."""
         mock_exists.return_value = True
+        _read_budget_cached.cache_clear()
         
         result = self.data_manager._validate_budget_file()
         
@@ -82,7 +82,7 @@ class TestExpenseRegistrationWorkflow(unittest.TestCase):
         current_month = datetime.now().month
         current_year = datetime.now().year
         
-        analysis_result = self.data_manager.get_monthly_analysis(current_month, current_year)
+        analysis_result = self.data_manager.get_monthly_analysis(current_month, current_year, include_records=True)
         self.assertTrue(analysis_result.success)
         
         # Step 4: Verify analysis results
@@ -286,7 +286,7 @@ class TestInvestmentRegistrationWorkflow(unittest.TestCase):
         df.to_excel(self.mock_config.XLSX_INVERSIONES, index=False)
         
         # Generate analysis for July 2025
-        analysis_result = self.data_manager.get_monthly_analysis(7, 2025)
+        analysis_result = self.data_manager.get_monthly_analysis(7, 2025, include_records=True)
         self.assertTrue(analysis_result.success)
         
         # Verify calculations
@@ -7,7 +7,7 @@ Tests character escaping, currency handling, and text processing functionality.
 import unittest
 from unittest.mock import patch
 
-from services.latex_processor import LaTeXProcessor
+from services.latex_processor import LaTeXProcessor, _escape_cached
 from services.exceptions import LaTeXError
 
 
@@ -35,6 +35,23 @@ class TestLaTeXProcessor(unittest.TestCase):
         result = self.processor.escape_special_characters(text)
         self.assertEqual(result, text)
     
+    @patch('services.latex_processor.logger')
+    def test_escape_special_characters_clean_text_fast_path(self, mock_logger):
+        """Test text without special characters is returned unchanged without logging."""
+        text = "Almuerzo con clientes en el centro"
+        result = self.processor.escape_special_characters(text)
+        self.assertIs(result, text)
+        mock_logger.debug.assert_not_called()
+    
+    def test_escape_special_characters_memoized(self):
+        """Test repeated inputs with special characters reuse the cached result."""
+        _escape_cached.cache_clear()
+        first = self.processor.escape_special_characters("Supermercado 50% off & más")
+        second = self.processor.escape_special_characters("Supermercado 50% off & más")
+        self.assertEqual(first, "Supermercado 50\\% off \\& más")
+        self.assertIs(first, second)
+        self.assertEqual(_escape_cached.cache_info().hits, 1)
+    
     def test_escape_special_characters_dollar_sign(self):
         """Test escaping dollar sign."""
         text = "This costs $50"
@@ -330,6 +347,14 @@ class TestLaTeXProcessor(unittest.TestCase):
         # Verify no double-escaping occurred
         self.assertNotIn("\\\\", result)
         self.assertNotIn("textbackslashtextbackslash", result)
+    
+    def test_backslash_escaped_in_single_pass(self):
+        """Test backslashes are escaped once and placeholder-like text is left alone."""
+        self.assertEqual(self.processor.escape_special_characters("a\\b"), "a\\textbackslash{}b")
+        self.assertEqual(
+            self.processor.escape_special_characters("XBACKSLASHX \\"),
+            "XBACKSLASHX \\textbackslash{}"
+        )
 
 
 if __name__ == '__main__':
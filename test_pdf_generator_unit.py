@@ -8,9 +8,11 @@ import unittest
 from unittest.mock import Mock, patch, mock_open, MagicMock
 import os
 import subprocess
+import tempfile
 from dataclasses import dataclass
+from jinja2 import Environment
 
-from services.pdf_generator import PDFGenerator, PDFResult, CompilationResult
+from services.pdf_generator import PDFGenerator, PDFResult, CompilationResult, _trim_latex_output
 from services.latex_processor import LaTeXProcessor
 from services.exceptions import LaTeXError, ConfigurationError
 
@@ -53,6 +55,26 @@ class TestPDFGenerator(unittest.TestCase):
             timeout=10
         )
     
+    @patch('services.pdf_generator.subprocess.run')
+    def test_check_latex_availability_memoized(self, mock_run):
+        """Test that the pdflatex probe runs only once per generator."""
+        mock_run.return_value = Mock(returncode=0, stdout="pdfTeX 3.14159265")
+        
+        self.assertTrue(self.pdf_generator.check_latex_availability())
+        self.assertTrue(self.pdf_generator.check_latex_availability())
+        
+        mock_run.assert_called_once()
+    
+    @patch('services.pdf_generator.subprocess.run')
+    def test_check_latex_availability_probes_again_after_failure(self, mock_run):
+        """Test that a missing pdflatex is not memoized, so a later install is detected."""
+        mock_run.side_effect = [FileNotFoundError(), Mock(returncode=0, stdout="pdfTeX 3.14159265")]
+        
+        self.assertFalse(self.pdf_generator.check_latex_availability())
+        self.assertTrue(self.pdf_generator.check_latex_availability())
+        
+        self.assertEqual(mock_run.call_count, 2)
+    
     @patch('services.pdf_generator.subprocess.run')
     def test_check_latex_availability_not_found(self, mock_run):
         """Test LaTeX availability check when pdflatex is not found."""
@@ -139,6 +161,43 @@ class TestPDFGenerator(unittest.TestCase):
             timeout=60
         )
     
+    @patch('services.pdf_generator.PDFGenerator.check_latex_availability')
+    @patch('services.pdf_generator.os.path.exists')
+    @patch('services.pdf_generator.os.makedirs')
+    @patch('services.pdf_generator.subprocess.run')
+    def test_compile_to_pdf_reruns_for_cross_references(self, mock_run, mock_makedirs, mock_exists, mock_check):
+        """Test that pdflatex is run again only when the log asks for it."""
+        mock_check.return_value = True
+        mock_exists.side_effect = lambda path: path == "test.tex" or path.endswith("test.pdf")
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.", stderr=""),
+            Mock(returncode=0, stdout="Output written on test.pdf", stderr="")
+        ]
+        
+        result = self.pdf_generator.compile_to_pdf("test.tex", "output")
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "Output written on test.pdf")
+        self.assertEqual(mock_run.call_count, 2)
+    
+    @patch('services.pdf_generator.PDFGenerator.check_latex_availability')
+    @patch('services.pdf_generator.os.path.exists')
+    @patch('services.pdf_generator.os.makedirs')
+    @patch('services.pdf_generator.subprocess.run')
+    def test_compile_to_pdf_without_keeping_logs(self, mock_run, mock_makedirs, mock_exists, mock_check):
+        """Test that pdflatex output is discarded when logs are not kept."""
+        generator = PDFGenerator(latex_processor=self.mock_latex_processor, keep_logs=False)
+        mock_check.return_value = True
+        mock_exists.side_effect = lambda path: path == "test.tex" or path.endswith("test.pdf")
+        mock_run.return_value = Mock(returncode=0, stdout=None, stderr=None)
+        
+        result = generator.compile_to_pdf("test.tex", "output")
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(mock_run.call_args.kwargs['stdout'], subprocess.DEVNULL)
+        self.assertNotIn('capture_output', mock_run.call_args.kwargs)
+    
     @patch('services.pdf_generator.PDFGenerator.check_latex_availability')
     @patch('services.pdf_generator.os.path.exists')
     @patch('services.pdf_generator.os.makedirs')
@@ -267,6 +326,36 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertEqual(result, "Rendered template content")
         mock_template.render.assert_called_once()
     
+    def test_process_template_reuses_environment(self):
+        """Test that the Jinja2 environment is built once per template directory."""
+        self.mock_latex_processor.escape_special_characters.side_effect = lambda x: x
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = os.path.join(temp_dir, "template.tex")
+            with open(template_path, 'w', encoding='utf-8') as f:
+                f.write("Hola {{ name }}")
+            
+            with patch('services.pdf_generator.Environment', wraps=Environment) as mock_env_class:
+                first = self.pdf_generator.process_template(template_path, {"name": "A"})
+                second = self.pdf_generator.process_template(template_path, {"name": "B"})
+            
+            self.assertEqual(first, "Hola A")
+            self.assertEqual(second, "Hola B")
+            mock_env_class.assert_called_once()
+    
+    def test_precompile_templates(self):
+        """Test that templates are compiled ahead of time and broken ones skipped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "valid.tex"), 'w', encoding='utf-8') as f:
+                f.write("Hola {{ name }}")
+            with open(os.path.join(temp_dir, "broken.tex"), 'w', encoding='utf-8') as f:
+                f.write("{% if %}")
+            
+            compiled = self.pdf_generator.precompile_templates(temp_dir)
+            
+            self.assertEqual(compiled, 1)
+            self.assertIn(temp_dir, self.pdf_generator._jinja_envs)
+    
     def test_process_template_data_strings(self):
         """Test processing template data with strings."""
         self.mock_latex_processor.escape_special_characters.side_effect = lambda x: f"escaped_{x}"
@@ -324,6 +413,21 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertTrue(result)
         mock_makedirs.assert_not_called()  # Directory already exists
     
+    @patch('services.pdf_generator.os.makedirs')
+    @patch('services.pdf_generator.os.path.exists')
+    @patch('services.pdf_generator.os.path.isdir')
+    @patch('services.pdf_generator.os.access')
+    def test_ensure_directory_structure_memoized(self, mock_access, mock_isdir, mock_exists, mock_makedirs):
+        """Test that a validated directory is not checked again."""
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
+        mock_access.return_value = True
+        
+        self.assertTrue(self.pdf_generator.ensure_directory_structure("test_dir"))
+        self.assertTrue(self.pdf_generator.ensure_directory_structure("test_dir"))
+        
+        mock_exists.assert_called_once_with("test_dir")
+    
     @patch('services.pdf_generator.os.makedirs')
     @patch('services.pdf_generator.os.path.exists')
     @patch('services.pdf_generator.os.path.isdir')
@@ -425,6 +529,20 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertIn('firma.png', result['copied_files'])
         self.assertEqual(result['total_failed'], 0)
     
+    def test_fast_copy_skips_up_to_date_destination(self):
+        """Test resource copies are linked or copied once and then skipped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, "logo.png")
+            dest_path = os.path.join(temp_dir, "out_logo.png")
+            with open(source_path, 'wb') as f:
+                f.write(b"\x89PNG data")
+            
+            self.assertTrue(self.pdf_generator._fast_copy(source_path, dest_path))
+            self.assertFalse(self.pdf_generator._fast_copy(source_path, dest_path))
+            
+            with open(dest_path, 'rb') as f:
+                self.assertEqual(f.read(), b"\x89PNG data")
+    
     @patch('services.pdf_generator.os.path.exists')
     def test_copy_template_resources_missing_files(self, mock_exists):
         """Test template resource copying with missing files."""
@@ -437,6 +555,28 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertIn('logo.png', result['missing_files'])
         self.assertIn('firma.png', result['missing_files'])
     
+    @patch('services.pdf_generator.shutil.which')
+    def test_linearize_pdf_without_qpdf(self, mock_which):
+        """Test that PDF optimization is skipped when qpdf is not installed."""
+        mock_which.return_value = None
+        
+        self.assertFalse(self.pdf_generator._linearize_pdf("output/test.pdf"))
+    
+    @patch('services.pdf_generator.os.replace')
+    @patch('services.pdf_generator.os.path.exists')
+    @patch('services.pdf_generator.subprocess.run')
+    @patch('services.pdf_generator.shutil.which')
+    def test_linearize_pdf_with_qpdf(self, mock_which, mock_run, mock_exists, mock_replace):
+        """Test that the qpdf output replaces the PDF when qpdf reports success."""
+        mock_which.return_value = "/usr/bin/qpdf"
+        mock_exists.return_value = True
+        mock_run.return_value = Mock(returncode=3, stderr="")
+        
+        self.assertTrue(self.pdf_generator._linearize_pdf("output/test.pdf"))
+        
+        self.assertEqual(mock_run.call_args[0][0][:2], ["/usr/bin/qpdf", "--linearize"])
+        mock_replace.assert_called_once_with("output/test.pdf.opt", "output/test.pdf")
+    
     @patch('services.pdf_generator.os.path.exists')
     @patch('services.pdf_generator.os.access')
     def test_validate_file_permissions_success(self, mock_access, mock_exists):
@@ -558,6 +698,47 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertIn("PDF compilation failed", result.message)
         self.assertEqual(result.compilation_log, "Compilation failed")
 
+    
+    def test_generate_resolutions_preserves_job_order(self):
+        """Test batch generation returns one result per job, in job order."""
+        jobs = [
+            {"template_path": "template.tex", "data": {"n": i},
+             "output_dir": "output", "filename_base": f"res_{i}"}
+            for i in range(5)
+        ]
+        
+        with patch.object(self.pdf_generator, 'generate_resolution',
+                          side_effect=lambda **job: PDFResult(success=True, message=job['filename_base'])) as mock_generate:
+            results = self.pdf_generator.generate_resolutions(jobs, max_workers=3)
+        
+        self.assertEqual([r.message for r in results], [f"res_{i}" for i in range(5)])
+        self.assertEqual(mock_generate.call_count, 5)
+    
+    def test_generate_resolutions_empty(self):
+        """Test batch generation with no jobs."""
+        self.assertEqual(self.pdf_generator.generate_resolutions([]), [])
+
+
+class TestTrimLatexOutput(unittest.TestCase):
+    """Test cases for pdflatex output trimming."""
+    
+    def test_short_output_unchanged(self):
+        """Test that short logs are kept verbatim."""
+        output = "line 1\nline 2"
+        self.assertEqual(_trim_latex_output(output, tail_lines=5), output)
+        self.assertIsNone(_trim_latex_output(None))
+    
+    def test_long_output_keeps_errors_and_tail(self):
+        """Test that long logs keep LaTeX error lines and the last lines."""
+        lines = [f"info {i}" for i in range(50)]
+        lines[10] = "! Undefined control sequence."
+        
+        trimmed = _trim_latex_output("\n".join(lines), tail_lines=5).split("\n")
+        
+        self.assertEqual(trimmed[0], "! Undefined control sequence.")
+        self.assertIn("44 lines omitted", trimmed[1])
+        self.assertEqual(trimmed[2:], lines[-5:])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
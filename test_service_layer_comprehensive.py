@@ -97,10 +97,9 @@ class TestDataManagerComprehensive(unittest.TestCase):
             content = f.read()
             self.assertIn("Café con leche", content)
     
-    @patch('services.data_manager.datetime')
-    def test_register_expense_uses_current_date(self, mock_datetime):
+    @patch('services.data_manager._today_iso', return_value="2025-07-24")
+    def test_register_expense_uses_current_date(self, mock_today):
         """Test that expense registration uses current date."""
-        mock_datetime.now.return_value.strftime.return_value = "2025-07-24"
         
         result = self.data_manager.register_expense(100.0, "Test", "Description")
         
@@ -184,7 +183,7 @@ class TestDataManagerComprehensive(unittest.TestCase):
             writer = csv.writer(f)
             writer.writerows(expense_data)
         
-        result = self.data_manager.get_monthly_analysis(7, 2025)
+        result = self.data_manager.get_monthly_analysis(7, 2025, include_records=True)
         
         self.assertTrue(result.success)
         self.assertEqual(result.total_expenses, 350.0)  # Only July expenses
@@ -536,16 +535,16 @@ class TestPDFGeneratorComprehensive(unittest.TestCase):
         
         # Test command not found
         mock_run.side_effect = FileNotFoundError()
-        self.assertFalse(self.pdf_generator.check_latex_availability())
+        self.assertFalse(self.pdf_generator.check_latex_availability(refresh=True))
         
         # Test command fails
         mock_run.side_effect = None
         mock_run.return_value = MagicMock(returncode=1)
-        self.assertFalse(self.pdf_generator.check_latex_availability())
+        self.assertFalse(self.pdf_generator.check_latex_availability(refresh=True))
         
         # Test timeout
         mock_run.side_effect = subprocess.TimeoutExpired('pdflatex', 10)
-        self.assertFalse(self.pdf_generator.check_latex_availability())
+        self.assertFalse(self.pdf_generator.check_latex_availability(refresh=True))
     
     def test_process_template_data_nested_structures(self):
         """Test template data processing with deeply nested structures."""